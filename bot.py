@@ -2,14 +2,21 @@
 # Bot module - Main entry point for the bot.
 #######################################################
 import os
+import hashlib
+import json
 import logging
-import traceback
+import logging.handlers
+import queue
 import sys
 
 import asyncio
 import discord
+try:
+    # Optional faster event loop (not available on Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
 from discord.ext import commands
-from dotenv import load_dotenv
 
 # Ensure the project root (parent of this file) is on sys.path so `import bot.*` works
 # This makes running `python bot.py` behave similarly to `python -m bot.bot` for imports.
@@ -17,46 +24,172 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-# Load environment variables from .env file
-load_dotenv()
+from bot.util import command_sync
+from bot.util.env_cache import load_env
+from bot.util.perm_cache import permission_cache
 
 # Set up logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+# Records are put on a queue and written to stdout by a listener thread, so logging never blocks
+# the event loop on console I/O. The calling thread still renders the message (QueueHandler.prepare
+# merges the args and any traceback into it); the listener only adds the timestamp and level.
+_log_queue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler(sys.stdout)
+_log_stream.setFormatter(logging.Formatter("{asctime} {levelname} {message}", style="{"))
+log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)])
+log_listener.start()
+logger = logging.getLogger("bot")
 
-# Ensure an asyncio event loop is available (fixes "There is no current event loop in thread 'MainThread'" on newer Python)
-try:
-    # get_running_loop raises RuntimeError if there is no current loop
-    asyncio.get_running_loop()
-except RuntimeError:
-    asyncio.set_event_loop(asyncio.new_event_loop())
+# Load environment variables from .env file (parsed values are cached in .env.cache)
+load_env()
 
 # Set up -> Bot client
-intents = discord.Intents.all()
-bot = commands.Bot(command_prefix='!', intents=intents)
+# The client binds to the current event loop when constructed, so the bot itself is
+# created by create_bot() inside main() rather than at import time.
+# Only the privileged intents the bot uses: members (member cache for get_member, role-change
+# events for the permission cache) and message_content (prefix commands such as !sync in guilds).
+# Presences are not used; DM content is delivered without message_content.
+intents = discord.Intents.default()
+intents.members = True
+intents.message_content = True
+bot: commands.Bot = None
+
+# Embed colours shared by the error handlers (discord.Color is immutable)
+_RED = discord.Color.dark_red()
+_ORANGE = discord.Color.orange()
+
+# File holding the hash of the last successfully synced command payloads
+SYNC_HASH_PATH = 'data/.sync_hash'
+
+# Extensions (cogs) loaded at startup
+EXTENSIONS = ('bot.cogs.moderation', 'bot.cogs.economy', 'bot.cogs.config', 'bot.cogs.applications')
 
 # Load extensions (cogs)
-def load_extensions():
-    extensions = ['bot.cogs.moderation', 'bot.cogs.economy', 'bot.cogs.config', 'bot.cogs.applications']
-    for ext in extensions:
+async def load_extensions():
+    """Load all cogs on the loop thread, one at a time, as load_extension (setup() and add_cog)
+    mutates the bot's command and listener tables.
+    """
+    for ext in EXTENSIONS:
         bot.load_extension(ext)
-    logging.info("Extensions loaded:" + ", ".join(extensions))
+    logger.info("Extensions loaded:" + ", ".join(EXTENSIONS))
+    bot._last_synced_hash = _load_sync_hash()
+
+# Slash command sync helpers
+def _commands_hash() -> str:
+    """Return a stable hash of the application command payloads currently registered."""
+    payloads = sorted((cmd.to_dict() for cmd in bot.pending_application_commands), key=lambda p: (p.get('type', 1), p['name']))
+    return hashlib.md5(json.dumps(payloads, sort_keys=True).encode('utf-8')).hexdigest()
+
+def _load_sync_hash() -> str | None:
+    """Return the hash persisted by the last successful sync, or None."""
+    try:
+        with open(SYNC_HASH_PATH, 'r') as fh:
+            return fh.read().strip() or None
+    except OSError:
+        return None
+
+def _save_sync_hash(value: str) -> None:
+    try:
+        with open(SYNC_HASH_PATH, 'w') as fh:
+            fh.write(value)
+    except OSError as e:
+        logger.warning(f'Failed to persist slash command sync hash: {e}')
 
 # Event: on_ready - Called when the bot is online & ready
-@bot.event
 async def on_ready():
-    logging.info(f'Logged in as {bot.user} (ID: {bot.user.id})')
-    try:
+    logger.info(f'Logged in as {bot.user} (ID: {bot.user.id})')
+    logger.info('------')
+
+# Events: keep cached permission decisions in step with role changes
+async def on_member_update(before: discord.Member, after: discord.Member):
+    if before.roles != after.roles:
+        permission_cache.invalidate_member(after.guild.id, after.id)
+
+async def on_guild_role_update(before: discord.Role, after: discord.Role):
+    if before.permissions != after.permissions:
+        permission_cache.invalidate_guild(after.guild.id)
+
+async def on_guild_role_delete(role: discord.Role):
+    permission_cache.invalidate_guild(role.guild.id)
+
+# Command: !sync - Owner-only slash command sync (use `!sync true` to force)
+@commands.command(name='sync')
+@commands.is_owner()
+async def sync(ctx: commands.Context, force: bool = False):
+    """Sync slash commands with Discord. Skipped when the command set is unchanged unless forced.
+    The sync strategy is chosen by the DISCORD_COMMAND_SYNC_POLICY environment variable (safe/bulk/off).
+    """
+    policy = command_sync.get_sync_policy()
+    if policy == 'off':
+        await ctx.send(f"Slash command sync is disabled ({command_sync.SYNC_POLICY_ENV}=off).")
+        return
+    current_hash = _commands_hash()
+    if not force and getattr(bot, '_last_synced_hash', None) == current_hash:
+        await ctx.send("Slash commands are already up to date.")
+        return
+    if policy == 'bulk':
         await bot.sync_commands()
-        logging.info('Slash commands synced successfully.')
-    except Exception as e:
-        logging.error(f'Failed to sync slash commands: {e}')
-    logging.info('------')
+        count = len(bot.pending_application_commands)
+        summary = f"Synced {count} slash command{'s' if count != 1 else ''}."
+    else:
+        stats = await command_sync.safe_sync(bot)
+        summary = "Synced slash commands: " + ", ".join(f"{n} {k}" for k, n in stats.items()) + "."
+    bot._last_synced_hash = current_hash
+    _save_sync_hash(current_hash)
+    logger.info(f'Slash commands synced by {ctx.author} ({policy}): {summary}')
+    await ctx.send(summary)
 
-def _error_embed(title: str, description: str, colour: discord.Color = discord.Color.dark_red()) -> discord.Embed:
-    embed = discord.Embed(title=title, description=description, colour=colour)
-    return embed
+# Command: !reload - Owner-only hot reload of a single cog
+@commands.command(name='reload')
+@commands.is_owner()
+async def reload(ctx: commands.Context, extension: str):
+    """Reload one cog in place, e.g. `!reload applications`. Run !sync afterwards if its slash commands changed."""
+    name = extension if extension.startswith('bot.cogs.') else f'bot.cogs.{extension}'
+    if name not in EXTENSIONS:
+        await ctx.send(f"Unknown extension `{extension}`. Loaded: {', '.join(e.rsplit('.', 1)[-1] for e in EXTENSIONS)}")
+        return
+    bot.reload_extension(name)
+    logger.info(f'Extension {name} reloaded by {ctx.author}')
+    await ctx.send(f"Reloaded `{name}`.")
+
+def _error_embed(title: str, description: str, colour: discord.Color = _RED) -> discord.Embed:
+    return discord.Embed(title=title, description=description, colour=colour)
+
+# Error handlers: exception type -> embed builder, looked up along the error's MRO
+def _handle_missing_perms(error: commands.MissingPermissions) -> discord.Embed:
+    perms = ", ".join(error.missing_permissions) if getattr(error, "missing_permissions", None) else "required permissions"
+    return _error_embed("Missing Permissions", f":x: You lack permission(s): {perms}", _ORANGE)
+
+def _handle_missing_arg(error: commands.MissingRequiredArgument) -> discord.Embed:
+    return _error_embed("Missing Argument", f":x: Missing required argument `{error.param.name}`.")
+
+def _handle_bad_arg(error: commands.BadArgument) -> discord.Embed:
+    return _error_embed("Bad Argument", ":x: One or more arguments are invalid.")
+
+def _handle_not_owner(error: commands.NotOwner) -> discord.Embed:
+    return _error_embed("Not Owner", ":x: Only the bot owner can run this command.")
+
+def _handle_check_failure(error: commands.CheckFailure) -> discord.Embed:
+    # Friendly message for failed checks (permissions / custom checks).
+    # If the CheckFailure carries a message, show it to the user; otherwise, show a generic message.
+    message = str(error) if str(error) else ":x: You do not have permission to run this command."
+    return _error_embed("Insufficient Permissions", message, _ORANGE)
+
+def _handle_forbidden(error: discord.Forbidden) -> discord.Embed:
+    return _error_embed("Insufficient Bot Permissions", ":x: I do not have permission to perform that action.")
+
+ERROR_HANDLERS = {
+    commands.MissingPermissions: _handle_missing_perms,
+    commands.MissingRequiredArgument: _handle_missing_arg,
+    commands.BadArgument: _handle_bad_arg,
+    commands.NotOwner: _handle_not_owner,
+    commands.CheckFailure: _handle_check_failure,
+    discord.Forbidden: _handle_forbidden,
+}
+
+# Errors whose reply is only shown to the invoking user
+_EPHEMERAL_ERRORS = frozenset({commands.MissingPermissions, commands.CheckFailure})
 
-@bot.event
 async def on_command_error(ctx: commands.Context, error: Exception) -> None:
     # Let command-level handlers run first
     if ctx.command and ctx.command.has_error_handler():
@@ -70,45 +203,63 @@ async def on_command_error(ctx: commands.Context, error: Exception) -> None:
     if isinstance(error, commands.CommandNotFound):
         return
 
-    # Build contextual embed responses
-    if isinstance(error, commands.MissingPermissions):
-        perms = ", ".join(error.missing_permissions) if getattr(error, "missing_permissions", None) else "required permissions"
-        embed = _error_embed("Missing Permissions", f":x: You lack permission(s): {perms}", discord.Color.orange())
-    elif isinstance(error, commands.MissingRequiredArgument):
-        embed = _error_embed("Missing Argument", f":x: Missing required argument `{error.param.name}`.")
-    elif isinstance(error, commands.BadArgument):
-        embed = _error_embed("Bad Argument", ":x: One or more arguments are invalid.")
-    elif isinstance(error, commands.NotOwner):
-        embed = _error_embed("Not Owner", ":x: Only the bot owner can run this command.")
-    elif isinstance(error, commands.CheckFailure):
-        # Friendly message for failed checks (permissions / custom checks).
-        # If the CheckFailure carries a message, show it to the user; otherwise, show a generic message.
-        message = str(error) if str(error) else ":x: You do not have permission to run this command."
-        embed = _error_embed("Insufficient Permissions", message, discord.Color.orange())
-    elif isinstance(error, discord.Forbidden):
-        embed = _error_embed("Insufficient Bot Permissions", ":x: I do not have permission to perform that action.")
+    # Build contextual embed responses; the most specific registered class in the MRO wins
+    for cls in type(error).__mro__:
+        handler = ERROR_HANDLERS.get(cls)
+        if handler is not None:
+            embed = handler(error)
+            break
     else:
         # Log unexpected errors and avoid leaking internals to users
-        tb = "".join(traceback.format_exception(type(error), error, getattr(error, "__traceback__", None)))
-        logging.error("Unhandled command error: %s\n%s", error, tb)
+        logger.error("Unhandled command error: %s", error, exc_info=(type(error), error, error.__traceback__))
         embed = _error_embed("Error", ":interrobang: An internal error occurred. Please view the console for more information.")
 
     # Try to send a reply. If this is an ApplicationContext (slash command) attempt to use respond so replies are visible to the user.
     try:
-        if hasattr(ctx, "respond") and callable(getattr(ctx, "respond")):
+        if isinstance(ctx, discord.ApplicationContext):
             # Use ephemeral reply for permission-related errors so it's private to the user.
-            ephemeral = isinstance(error, (commands.MissingPermissions, commands.CheckFailure))
+            # Checked along the MRO so CheckFailure subclasses (NotOwner, ...) stay ephemeral.
+            ephemeral = not _EPHEMERAL_ERRORS.isdisjoint(type(error).__mro__)
             await ctx.respond(embed=embed, ephemeral=ephemeral)
         else:
             await ctx.send(embed=embed)
     except Exception as e:
-        logging.exception(f"Failed to send error embed: {e}")
+        logger.exception(f"Failed to send error embed: {e}")
 
 
-# Main entry point
-if __name__ == '__main__':
-    load_extensions()
+def create_bot() -> commands.Bot:
+    """Create the bot client and register its events and commands.
+    Must be called from inside the running event loop.
+    """
+    # auto_sync_commands is disabled; slash commands are synced on demand with !sync
+    new_bot = commands.Bot(command_prefix='!', intents=intents, auto_sync_commands=False)
+    new_bot.event(on_ready)
+    new_bot.event(on_command_error)
+    new_bot.add_listener(on_member_update)
+    new_bot.add_listener(on_guild_role_update)
+    new_bot.add_listener(on_guild_role_delete)
+    new_bot.add_command(sync)
+    new_bot.add_command(reload)
+    return new_bot
+
+async def main():
+    global bot
     TOKEN = os.getenv('DISCORD_TOKEN')
     if not TOKEN:
         raise ValueError("DISCORD_TOKEN environment variable not set.")
-    bot.run(TOKEN)
+    bot = create_bot()
+    await load_extensions()
+    try:
+        await bot.start(TOKEN)
+    finally:
+        if not bot.is_closed():
+            await bot.close()
+
+
+# Main entry point
+if __name__ == '__main__':
+    try:
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
+    finally:
+        # Flush queued log records before exiting
+        log_listener.stop()
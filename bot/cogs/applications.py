@@ -1,9 +1,16 @@
 #######################################################
 # Applications Cog - Provides applications-related commands for the bot
 #######################################################
+import asyncio
+import errno, shutil
+import logging
+import types
 import tempfile, os, time
+from typing import Optional
+import aiofiles
+import aiofiles.os
+import aiohttp
 import discord
-import json
 from discord.ext import commands
 
 # Import database and permission utilities with robust fallbacks using dynamic import
@@ -19,6 +26,163 @@ except Exception:
     # ensure perms_util is the module object used similarly to previous imports
     ApplicationsDatabase = importlib.import_module('core.database').ApplicationsDatabase
 
+logger = logging.getLogger(__name__)
+
+
+# Embed colours (discord.Color is immutable, so one instance each is shared)
+_RED = discord.Color.red()
+_ORANGE = discord.Color.orange()
+_GREEN = discord.Color.green()
+_BLUE = discord.Color.blue()
+
+# How long (seconds) cached applications-channel lookups stay valid
+_CACHE_TTL = 60
+# Chunk size used when streaming an uploaded database file to disk
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+# How long (seconds) the role IDs holding manage_applications are cached
+_PERM_ROLES_TTL = 30
+# How long (seconds) the full position list paged by /application list is cached
+_POSITIONS_TTL = 30
+# How long (seconds) a best-effort notification DM may take before it is abandoned
+_DM_TIMEOUT = 2.0
+# Most queued writes committed together in one transaction (see _write)
+# (kept small: the batch holds the writer lock, so other writes wait for all of it)
+_WRITE_BATCH_MAX = 16
+# How long (seconds) fetched/prefetched history pages stay valid, and how many are kept
+_HISTORY_CACHE_TTL = 30
+_HISTORY_CACHE_SIZE = 8
+# Applications shown per history page, and how many numbered pages are fetched in one query
+_HISTORY_PER_PAGE = 4
+_HISTORY_BUCKET_PAGES = 10
+# Characters of each application's answers shown in history (cut by the database query)
+_HISTORY_ANSWERS_CHARS = 800
+# Layout for one application in the history description
+_HISTORY_ROW_FMT = ("**App #{aid} — {status}**\n"
+                    "Applicant: <@{uid}> (ID: {uid})\n"
+                    "Position: {pname} (ID: {pid})\n"
+                    "Submitted: {sub}\n"
+                    "Answers:\n{ans}")
+# Discord's limit on an embed description
+_EMBED_DESCRIPTION_LIMIT = 4096
+# Submissions from flagged users ping the staff roles only
+_STAFF_PING = discord.AllowedMentions(everyone=False, users=False, roles=True)
+
+# Human-friendly appstatus names -> DB statuses (preserve existing 'rejected' value used elsewhere)
+_STATUS_MAPPING = types.MappingProxyType({
+    'pending': 'pending',
+    'under review': 'under_review',
+    'under_review': 'under_review',
+    'accepted': 'accepted',
+    'denied': 'rejected',
+    'rejected': 'rejected',
+    'withdrawn': 'withdrawn',
+    'flagged': 'flagged',
+    'on hold': 'on_hold',
+    'on_hold': 'on_hold'
+})
+
+
+# Static embeds sent by on_message; send a .copy() so the templates are never mutated
+_EMBED_NO_IN_PROGRESS = discord.Embed(
+    title="No In-Progress Application",
+    description="You don't have an in-progress application. Start one with `/application apply <position_name>` in the server.",
+    colour=_ORANGE
+)
+_EMBED_INVALID_STATE = discord.Embed(
+    title="Application Error",
+    description="Your in-progress application is in an unexpected state. Please contact staff.",
+    colour=_RED
+)
+_EMBED_RECORD_FAILED = discord.Embed(
+    title="Failed to Record Answer",
+    description="Failed to record your answer. Please contact staff.",
+    colour=_RED
+)
+_EMBED_ANSWER_RECORDED = discord.Embed(
+    title="Answer Recorded",
+    description="Recorded your answer. Awaiting next question (if any).",
+    colour=_BLUE
+)
+_EMBED_NO_GUILD = discord.Embed(
+    title="Submission Received",
+    description="Your application has been submitted, but I couldn't find the server to post it to. Please contact staff.",
+    colour=_ORANGE
+)
+_EMBED_NO_CHANNEL = discord.Embed(
+    title="Submission Received",
+    description="Your application has been submitted, but no applications channel is configured. Please contact staff.",
+    colour=_ORANGE
+)
+_EMBED_SUBMITTED = discord.Embed(
+    title="Application Submitted",
+    description="Your application has been submitted to staff for review. Thank you!",
+    colour=_GREEN
+)
+_EMBED_SUBMIT_FAILED = discord.Embed(
+    title="Submission Failed",
+    description="An error occurred while submitting your application. Please contact staff.",
+    colour=_RED
+)
+
+# Static embeds for the staff history/blacklist commands; send a .copy() as above
+_EMBED_HISTORY_DB_ERROR = discord.Embed(
+    title="Database Error",
+    description="Failed to fetch applications. Check logs.",
+    colour=_RED
+)
+_EMBED_NO_APPLICATIONS = discord.Embed(
+    title="No Applications",
+    description="There are no applications on record.",
+    colour=_ORANGE
+)
+_EMBED_BLACKLIST_FAILED = discord.Embed(
+    title="Blacklist Failed",
+    description="Failed to blacklist the user. Check logs.",
+    colour=_RED
+)
+_EMBED_UNBLACKLIST_FAILED = discord.Embed(
+    title="Unblacklist Failed",
+    description="Failed to remove the user's blacklist. Check logs.",
+    colour=_RED
+)
+
+# Static embeds for the applicant-facing list/withdraw/checkappstatus commands; send a .copy() as above
+_EMBED_NO_POSITIONS = discord.Embed(
+    title="No Application Positions",
+    description="There are currently no application positions defined.",
+    colour=_ORANGE
+)
+_EMBED_NOTHING_TO_WITHDRAW = discord.Embed(
+    title="No Submitted Application",
+    description="You don't have any submitted applications to withdraw.",
+    colour=_ORANGE
+)
+_EMBED_NOTHING_TO_CHECK = discord.Embed(
+    title="No Submitted Application",
+    description="You don't have any submitted applications to check.",
+    colour=_ORANGE
+)
+
+# Templates for the approve/reject embeds; handlers take a .copy() and fill in the per-call parts
+_TEMPLATE_APPROVED = discord.Embed(title="Application Approved", colour=_GREEN)
+_TEMPLATE_REJECTED = discord.Embed(title="Application Rejected", colour=_RED)
+_TEMPLATE_NOT_FOUND = discord.Embed(title="Application Not Found", colour=_RED)
+_TEMPLATE_ALREADY_PROCESSED = discord.Embed(title="Already Processed", colour=_ORANGE)
+_TEMPLATE_UPDATE_FAILED = discord.Embed(title="Failed to Update", colour=_RED)
+_TEMPLATE_ALREADY_WITHDRAWN = discord.Embed(title="Already Withdrawn", colour=_ORANGE)
+
+
+def _truncate(text: str, limit: int = 1900) -> str:
+    """Return `text` cut to `limit` characters with a trailing '...' if it is longer.
+    Newlines are kept (unlike textwrap.shorten), as answers and reasons are often multi-line.
+    """
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+async def _err(ctx: discord.ApplicationContext, title: str, description: str, ephemeral: bool = True) -> None:
+    """Respond to `ctx` with a red error embed."""
+    await ctx.respond(embed=discord.Embed(title=title, description=description, colour=_RED), ephemeral=ephemeral)
+
 
 # Applications cog
 class Applications(commands.Cog):
@@ -28,6 +192,304 @@ class Applications(commands.Cog):
         self.bot = bot
         # position structure: {'name': str, 'description': str, 'roles_given': list[int], 'questions': list[str], 'acceptance_message': str, 'rejection_message': str, 'open': bool}
         self.db = ApplicationsDatabase()
+        # TTL cache for the applications channel on the DM hot path: guild_id -> (cached_at, channel_id)
+        self._chan_cache: dict[int, tuple[float, Optional[int]]] = {}
+        self._perm_roles_cache: tuple[float, list[tuple[int, str]]] = (0.0, [])
+        # TTL cache for the total application count shown by history: (cached_at, count)
+        self._count_cache: Optional[tuple[float, int]] = None
+        # History rows, including prefetched ones: key -> (cached_at, rows, positions); see _history_rows
+        self._page_cache: dict[tuple, tuple[float, list, dict]] = {}
+        # Bumped by invalidate_history; a count or rows fetched under an older value are not cached
+        self._history_gen = 0
+        # TTL cache for /application list: (cached_at, (field name, field value) per position ordered by ID); see _position_fields
+        self._positions_cache: Optional[tuple[float, list[tuple[str, str]]]] = None
+        # The server this bot serves (single-guild bot); refreshed on ready, also set here for reloads
+        self._guild: Optional[discord.Guild] = bot.guilds[0] if bot.guilds else None
+        # Users with an in-progress application, so on_message can ignore every other DM without a query
+        self._active_users: set[int] = self.db.get_in_progress_user_ids()
+        # Queued status/flag writes, committed in batches by _drain_writes (started on first use)
+        self._write_queue: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
+        # Set by cog_unload; no new writes are queued after it
+        self._unloading = False
+        # Fire-and-forget tasks (see _spawn); referenced here so they are not garbage collected mid-run
+        self._background_tasks: set[asyncio.Task] = set()
+
+    def cog_unload(self):
+        self._unloading = True
+        if self._writer_task is not None and not self._writer_task.done():
+            # Let the writer commit everything queued so far, then stop and close the database (see _drain_writes)
+            self._write_queue.put_nowait(None)
+        else:
+            self._spawn(self._db(self.db.close))
+
+    # --- Cached lookups -----------------------------------------------------------
+    async def _apps_channel_id(self, guild_id: int) -> Optional[int]:
+        """Return the configured applications channel ID for a guild, cached for _CACHE_TTL seconds."""
+        now = time.monotonic()
+        cached = self._chan_cache.get(guild_id)
+        if cached and now - cached[0] < _CACHE_TTL:
+            return cached[1]
+        channel_id = await self._db(self.db.get_applications_channel, guild_id)
+        self._chan_cache[guild_id] = (now, channel_id)
+        return channel_id
+
+    async def _applications_count(self) -> int:
+        """Return the total number of applications, cached for _CACHE_TTL seconds."""
+        now = time.monotonic()
+        cached = self._count_cache
+        if cached and now - cached[0] < _CACHE_TTL:
+            return cached[1]
+        gen = self._history_gen
+        count = await self._db(self.db.get_applications_count)
+        if gen == self._history_gen:
+            self._count_cache = (now, count)
+        return count
+
+    async def _position_fields(self) -> list[tuple[str, str]]:
+        """Return the /application list embed field (name, value) for every position ordered by ID,
+        cached for _POSITIONS_TTL seconds so paging only slices preformatted tuples."""
+        now = time.monotonic()
+        cached = self._positions_cache
+        if cached and now - cached[0] < _POSITIONS_TTL:
+            return cached[1]
+        positions = sorted(await self._db(self.db.get_positions), key=lambda p: p['position_id'])
+        fields = [(pos['name'].title(), f"Description: {pos.get('description', 'No description provided.')}") for pos in positions]
+        self._positions_cache = (now, fields)
+        return fields
+
+    async def _position_or_respond(self, ctx: discord.ApplicationContext, name: str, hint: str = "", ephemeral: bool = True) -> Optional[dict]:
+        """Look up a position by name (case-insensitive), replying with a not-found error if it doesn't exist.
+        Parameters:
+            name (str): The position name as typed by the user.
+            hint (str): Extra text appended to the not-found message.
+            ephemeral (bool): Whether the not-found reply is ephemeral.
+        Returns:
+            dict | None: The position, or None after replying.
+        """
+        # Positions are stored casefolded by create
+        position = await self._db(self.db.get_position, name.strip().casefold())
+        if not position:
+            await _err(ctx, "Position Not Found", f"No application position found with the name '{name}'.{hint}", ephemeral=ephemeral)
+        return position
+
+    def invalidate_history(self) -> None:
+        """Forget the cached application count and history pages (call after changing applications)."""
+        self._history_gen += 1
+        self._count_cache = None
+        self._page_cache.clear()
+
+    @staticmethod
+    def _history_key(page: int, before: Optional[int]) -> tuple:
+        """Cache key for the rows behind a history page: the cursor, or the bucket holding a numbered page."""
+        if before is not None:
+            return ('before', before)
+        return ('bucket', (page - 1) // _HISTORY_BUCKET_PAGES)
+
+    async def _history_rows(self, key: tuple) -> tuple[list, dict]:
+        """Return (rows, positions) for a history cache key, from the page cache when fresh.
+        A cursor key holds one page plus one row; a bucket key holds _HISTORY_BUCKET_PAGES pages plus one row.
+        The extra row only signals that there is a next page.
+        """
+        now = time.monotonic()
+        cached = self._page_cache.get(key)
+        if cached and now - cached[0] < _HISTORY_CACHE_TTL:
+            return cached[1], cached[2]
+
+        gen = self._history_gen
+        kind, value = key
+        if kind == 'before':
+            rows = await self._db(self.db.get_applications_before, value, _HISTORY_PER_PAGE + 1, _HISTORY_ANSWERS_CHARS)
+        elif value == 0:
+            rows = await self._db(self.db.get_applications_before, None, _HISTORY_BUCKET_PAGES * _HISTORY_PER_PAGE + 1, _HISTORY_ANSWERS_CHARS)
+        else:
+            size = _HISTORY_BUCKET_PAGES * _HISTORY_PER_PAGE
+            rows = await self._db(self.db.get_applications, size + 1, value * size, _HISTORY_ANSWERS_CHARS)
+
+        # Resolve every position in the window in one query
+        try:
+            positions = await self._db(self.db.get_positions_bulk, [app.get('position_id') for app in rows])
+        except Exception:
+            logger.exception("Failed to fetch positions for applications history")
+            return rows, {}
+
+        if gen != self._history_gen:
+            # Applications changed while this ran (e.g. a prefetch); the rows may predate that change
+            return rows, positions
+        if key not in self._page_cache and len(self._page_cache) >= _HISTORY_CACHE_SIZE:
+            # Evict the oldest entry
+            self._page_cache.pop(next(iter(self._page_cache)))
+        self._page_cache[key] = (now, rows, positions)
+        return rows, positions
+
+    async def _history_page(self, page: int, before: Optional[int]) -> tuple[list, dict]:
+        """Return (rows, positions) for one history page; rows holds up to _HISTORY_PER_PAGE + 1 applications."""
+        rows, positions = await self._history_rows(self._history_key(page, before))
+        if before is None:
+            start = (page - 1) % _HISTORY_BUCKET_PAGES * _HISTORY_PER_PAGE
+            rows = rows[start:start + _HISTORY_PER_PAGE + 1]
+        return rows, positions
+
+    def _staff_roles(self) -> list[tuple[int, str]]:
+        """Return (role_id, mention) pairs for roles mapped to manage_applications, cached for _PERM_ROLES_TTL seconds."""
+        now = time.monotonic()
+        cached_at, roles = self._perm_roles_cache
+        if cached_at and now - cached_at < _PERM_ROLES_TTL:
+            return roles
+        roles = []
+        for rid in perms_util.get_roles_for_permission("manage_applications") or []:
+            try:
+                rid_int = int(rid)
+            except (TypeError, ValueError):
+                continue
+            roles.append((rid_int, '<@&%d>' % rid_int))
+        self._perm_roles_cache = (now, roles)
+        return roles
+
+    def cache_clear(self) -> None:
+        """Drop all cached channel, position, history and staff role lookups (call after changing them outside this cog)."""
+        self._chan_cache.clear()
+        self.invalidate_history()
+        self.db.clear_position_cache()
+        self._positions_cache = None
+        self._perm_roles_cache = (0.0, [])
+
+    @staticmethod
+    async def _db(fn, *args, **kwargs):
+        """Run a blocking ApplicationsDatabase call in a worker thread so SQLite never stalls the event loop."""
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def _write(self, fn, *args, **kwargs):
+        """Queue a write method of self.db and return its result once committed.
+        Writes queued while a batch is being committed are grouped into the next single transaction.
+        """
+        if self._unloading:
+            raise RuntimeError("The applications cog is unloading; the write was not queued.")
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._drain_writes())
+        future = asyncio.get_running_loop().create_future()
+        self._write_queue.put_nowait((fn, args, kwargs, future))
+        result = await future
+        # Statuses shown in history may have changed
+        self.invalidate_history()
+        return result
+
+    async def _drain_writes(self) -> None:
+        """Background task: commit queued writes in batches of up to _WRITE_BATCH_MAX.
+        Stops at the None that cog_unload queues, after committing everything queued before it,
+        and then closes the database.
+        """
+        batch = []
+        try:
+            stop = False
+            while not stop:
+                entry = await self._write_queue.get()
+                if entry is None:
+                    break
+                batch = [entry]
+                while len(batch) < _WRITE_BATCH_MAX and not self._write_queue.empty():
+                    entry = self._write_queue.get_nowait()
+                    if entry is None:
+                        stop = True
+                        break
+                    batch.append(entry)
+                try:
+                    results = await self._db(self.db.run_batch, [(fn, args, kwargs) for fn, args, kwargs, _ in batch])
+                except Exception as e:
+                    results = [(False, e)] * len(batch)
+                for (*_, future), (ok, value) in zip(batch, results):
+                    if future.done():
+                        continue
+                    if ok:
+                        future.set_result(value)
+                    else:
+                        future.set_exception(value)
+                batch = []
+        finally:
+            # Cancelled or stopped with writes still waiting: fail them so no command awaits forever
+            while not self._write_queue.empty():
+                entry = self._write_queue.get_nowait()
+                if entry is not None:
+                    batch.append(entry)
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("The write queue stopped before this write was confirmed."))
+        if self._unloading:
+            await self._db(self.db.close)
+
+    async def _resolve_member(self, guild: Optional[discord.Guild], user_id: int) -> Optional[discord.Member]:
+        """Return the guild member for `user_id`, or None if they are not in the guild.
+        With the members intent the cache is authoritative, so the REST fallback only runs without it.
+        """
+        if guild is None:
+            return None
+        member = guild.get_member(user_id)
+        if member is None and not self.bot.intents.members:
+            try:
+                member = await guild.fetch_member(user_id)
+            except discord.HTTPException:
+                member = None
+        return member
+
+    @staticmethod
+    async def _safe_send(channel, timeout: Optional[float] = None, **kwargs) -> None:
+        """Send to `channel`, ignoring failures such as a user with DMs closed.
+        With `timeout`, give up after that many seconds (e.g. while rate limited).
+        """
+        try:
+            await asyncio.wait_for(channel.send(**kwargs), timeout=timeout)
+        except (discord.HTTPException, asyncio.TimeoutError):
+            pass
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run `coro` in the background, off the command's response path. Failures are reported, not raised."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_task_done)
+        return task
+
+    def _background_task_done(self, task: asyncio.Task) -> None:
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background task failed", exc_info=task.exception())
+
+    async def _notify_decision(self, member: Optional[discord.Member], user_id: int, dm_embed: discord.Embed,
+                               public_embed: discord.Embed, channel) -> tuple:
+        """DM the applicant about a decision, posting `public_embed` to `channel` instead if the DM fails.
+        The channel post runs in the background so it does not delay the staff response.
+
+        Returns (dm_sent, dm_error, channel_queued); dm_error is None, 'forbidden' or 'failed'.
+        """
+        try:
+            user = member or self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+            await user.send(embed=dm_embed)
+            return True, None, False
+        except discord.Forbidden:
+            dm_error = 'forbidden'
+        except Exception:
+            logger.exception("Failed to DM decision to user %s", user_id)
+            dm_error = 'failed'
+
+        # DM failed: log to the applications channel without waiting for it
+        if channel is None:
+            return False, dm_error, False
+        self._spawn(channel.send(embed=public_embed))
+        return False, dm_error, True
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        self._guild = self.bot.guilds[0] if self.bot.guilds else None
+
+    # Keep the cached guild in step when the bot joins or leaves a server
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        if self._guild is None:
+            self._guild = guild
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        if self._guild is not None and self._guild.id == guild.id:
+            self._guild = self.bot.guilds[0] if self.bot.guilds else None
 
     # DM listener to handle app responses
     @commands.Cog.listener()
@@ -42,261 +504,153 @@ class Applications(commands.Cog):
           when all questions are answered.
         - The application must be submitted within 24 hours (enforced by the DB methods).
         """
-        # Ignore non-DMs and bot messages
-        if not isinstance(message.channel, discord.DMChannel):
-            return
-        if message.author.bot:
+        # Ignore non-DMs (guild messages carry their guild) and bot messages
+        if message.guild is not None or message.author.bot:
             return
 
         # Check if the user has an in-progress application
-        in_progress = self.db.get_in_progress_application(message.author.id)
-        if not in_progress:
+        if message.author.id not in self._active_users:
             return  # nothing to do
 
         # Build answer text from message content and attachments
         answers = message.content or ""
-        if message.attachments:
-            attachments_text = "\n\nAttachments:\n" + "\n".join(a.url for a in message.attachments)
-            answers = (answers + attachments_text).strip()
+        attachments = message.attachments
+        if attachments:
+            # Single attachment (the common case) needs no join
+            urls = attachments[0].url if len(attachments) == 1 else "\n".join(a.url for a in attachments)
+            answers = f"{answers}\n\nAttachments:\n{urls}".strip()
 
         # Append answer to in-progress application using new DB helper
-        res = self.db.add_answer_to_in_progress(message.author.id, answers)
-        if not res or not res[0]:
-            # Failure -- determine reason
-            reason = res[1] if isinstance(res, tuple) and len(res) > 1 else 'unknown'
+        # Result is (True, completed, application_id, position_id, next_question, final_answers, answered_count)
+        # on success and (False, reason) on failure
+        ok, *rest = await self._db(self.db.add_answer_to_in_progress, message.author.id, answers)
+        if not ok:
+            # A broken in-progress application may have been deleted
+            self.invalidate_history()
+            reason = rest[0]
+            if reason in ('no_in_progress', 'expired'):
+                self._active_users.discard(message.author.id)
             if reason == 'no_in_progress':
-                try:
-                    embed = discord.Embed(
-                        title="No In-Progress Application",
-                        description="You don't have an in-progress application. Start one with `/application apply <position_name>` in the server.",
-                        colour=discord.Color.orange()
-                    )
-                    await message.channel.send(embed=embed)
-                except discord.Forbidden:
-                    pass
+                await self._safe_send(message.channel, embed=_EMBED_NO_IN_PROGRESS.copy())
                 return
             if reason == 'invalid_in_progress_state':
-                try:
-                    embed = discord.Embed(
-                        title="Application Error",
-                        description="Your in-progress application is in an unexpected state. Please contact staff.",
-                        colour=discord.Color.red()
-                    )
-                    await message.channel.send(embed=embed)
-                except discord.Forbidden:
-                    pass
+                await self._safe_send(message.channel, embed=_EMBED_INVALID_STATE.copy())
                 return
             # Generic failure
-            try:
-                embed = discord.Embed(
-                    title="Failed to Record Answer",
-                    description="Failed to record your answer. Please contact staff.",
-                    colour=discord.Color.red()
-                )
-                await message.channel.send(embed=embed)
-            except discord.Forbidden:
-                pass
+            await self._safe_send(message.channel, embed=_EMBED_RECORD_FAILED.copy())
             return
 
-        # res is (True, completed, application_id, position_id, next_question, final_answers)
-        _, completed, application_id, position_id, next_question, final_answers = res
+        completed, application_id, position_id, next_question, final_answers, answered_count = rest
+        self.invalidate_history()
+        if completed:
+            self._active_users.discard(message.author.id)
 
         # If not completed, send the next question or a confirmation
         if not completed:
             if next_question:
-                # Compute which question number we're on by inspecting the stored in-progress answers
-                try:
-                    in_prog = self.db.get_in_progress_application(message.author.id)
-                    answered_count = 0
-                    if in_prog and in_prog.get('answers'):
-                        raw = in_prog.get('answers')
-                        try:
-                            parsed = json.loads(raw)
-                            if isinstance(parsed, dict) and isinstance(parsed.get('answers'), list):
-                                answered_count = len(parsed.get('answers'))
-                        except Exception:
-                            # If not JSON, fallback to treating as a single answered blob
-                            answered_count = 1
-                    question_num = answered_count + 1
-                except Exception:
-                    question_num = None
-
-                # Send a single embed that includes the question number (if available) and the question text
-                try:
-                    q_title = f"Question {question_num}" if question_num else "Next Question"
-                    q_embed = discord.Embed(
-                        title=q_title,
-                        description=next_question,
-                        colour=discord.Color.blue()
-                    )
-                    await message.channel.send(embed=q_embed)
-                except discord.Forbidden:
-                    pass
+                # Send a single embed that includes the question number and the question text
+                q_embed = discord.Embed(
+                    title=f"Question {answered_count + 1}",
+                    description=next_question,
+                    colour=_BLUE
+                )
+                await self._safe_send(message.channel, embed=q_embed)
                 return
             else:
                 # No next question found (shouldn't happen) - tell user to wait
-                try:
-                    embed = discord.Embed(
-                        title="Answer Recorded",
-                        description="Recorded your answer. Awaiting next question (if any).",
-                        colour=discord.Color.blue()
-                    )
-                    await message.channel.send(embed=embed)
-                except discord.Forbidden:
-                    pass
+                await self._safe_send(message.channel, embed=_EMBED_ANSWER_RECORDED.copy())
                 return
 
         # Completed submission - notify staff channel and user
         # Find the guild (this bot is intended for a single server)
-        guild = None
-        if self.bot.guilds:
-            guild = self.bot.guilds[0]
+        guild = self._guild
         if not guild:
-            try:
-                embed = discord.Embed(
-                    title="Submission Received",
-                    description="Your application has been submitted, but I couldn't find the server to post it to. Please contact staff.",
-                    colour=discord.Color.orange()
-                )
-                await message.channel.send(embed=embed)
-            except discord.Forbidden:
-                pass
+            await self._safe_send(message.channel, embed=_EMBED_NO_GUILD.copy())
             return
 
         # Get the configured applications channel for the guild
-        channel_id = self.db.get_applications_channel(guild.id)
+        channel_id = await self._apps_channel_id(guild.id)
         if not channel_id:
-            try:
-                embed = discord.Embed(
-                    title="Submission Received",
-                    description="Your application has been submitted, but no applications channel is configured. Please contact staff.",
-                    colour=discord.Color.orange()
-                )
-                await message.channel.send(embed=embed)
-            except discord.Forbidden:
-                pass
+            await self._safe_send(message.channel, embed=_EMBED_NO_CHANNEL.copy())
             return
 
         channel = guild.get_channel(channel_id)
         if not channel:
-            try:
-                embed = discord.Embed(
-                    title="Submission Received",
-                    description=f"Your application has been submitted, but the configured applications channel (ID {channel_id}) could not be found in the server. Please ping a management member.",
-                    colour=discord.Color.orange()
-                )
-                await message.channel.send(embed=embed)
-            except discord.Forbidden:
-                pass
+            embed = discord.Embed(
+                title="Submission Received",
+                description=f"Your application has been submitted, but the configured applications channel (ID {channel_id}) could not be found in the server. Please ping a management member.",
+                colour=_ORANGE
+            )
+            await self._safe_send(message.channel, embed=embed)
             return
 
         # Build an embed for staff review
-        position = self.db.get_position(position_id)
+        position = await self._db(self.db.get_position, position_id)
         position_name = position['name'] if position else f"ID {position_id}"
-        embed = discord.Embed(title=f"New Application: {position_name}", colour=discord.Color.blue())
+        embed = discord.Embed(title=f"New Application: {position_name}", colour=_BLUE)
         embed.add_field(name="Applicant", value=f"{message.author} (ID: {message.author.id})", inline=False)
         embed.add_field(name="Application ID", value=str(application_id), inline=True)
         embed.add_field(name="Position ID", value=str(position_id), inline=True)
-        truncated = (final_answers[:1900] + '...') if final_answers and len(final_answers) > 1900 else (final_answers or "(No content)")
+        answers_text = final_answers or "(No content)"
+        truncated = _truncate(answers_text)
         embed.add_field(name="Answers", value=truncated, inline=False)
         embed.set_footer(text="Use your normal review workflow to accept/reject and assign roles.")
 
         # If the user is flagged, prepare a mention string for staff roles and prepend it to the message
         mention_text = None
         try:
-            flagged = self.db.is_user_flagged(message.author.id, guild_id=guild.id)
+            flagged = await self._db(self.db.is_user_flagged, message.author.id, guild_id=guild.id)
             if flagged:
-                # Resolve roles that have the manage_applications permission
-                role_ids = perms_util.get_roles_for_permission("manage_applications") or []
-                # Convert and filter role ids to integers and ensure they exist in the guild
-                present_role_ids = []
-                for rid in role_ids:
-                    try:
-                        rid_int = int(rid)
-                    except Exception:
-                        continue
-                    if any(r.id == rid_int for r in guild.roles):
-                        present_role_ids.append(rid_int)
-                if present_role_ids:
-                    mention_text = ' '.join(f"<@&{r}>" for r in present_role_ids)
+                # Resolve roles that have the manage_applications permission and exist in the guild
+                mentions = [mention for rid, mention in self._staff_roles() if guild.get_role(rid) is not None]
+                if mentions:
+                    mention_text = ' '.join(mentions)
                 else:
                     # Fallback text if no role IDs are configured or resolvable
                     mention_text = "@Staff"
         except Exception:
             # If flag check fails, continue without mention
+            logger.exception("Failed to check flagged status for user %s", message.author.id)
             mention_text = None
 
         try:
-            if mention_text:
-                # Send mention first (so pings actually go through) then the embed
-                await channel.send(content=mention_text)
-            await channel.send(embed=embed)
-            try:
-                confirm_embed = discord.Embed(
-                    title="Application Submitted",
-                    description="Your application has been submitted to staff for review. Thank you!",
-                    colour=discord.Color.green()
-                )
-                await message.channel.send(embed=confirm_embed)
-            except discord.Forbidden:
-                pass
+            # Mentions in the content still ping when sent alongside the embed, so one message covers both
+            await channel.send(content=mention_text, embed=embed, allowed_mentions=_STAFF_PING)
+            await self._safe_send(message.channel, embed=_EMBED_SUBMITTED.copy())
         except discord.Forbidden:
             pass
-        except Exception as e:
-            try:
-                embed = discord.Embed(
-                    title="Submission Failed",
-                    description="An error occurred while submitting your application. Please contact staff.",
-                    colour=discord.Color.red()
-                )
-                await message.channel.send(embed=embed)
-            except discord.Forbidden:
-                pass
+        except Exception:
+            logger.exception("Failed to submit application for user %s", message.author.id)
+            await self._safe_send(message.channel, embed=_EMBED_SUBMIT_FAILED.copy())
 
 
     @application_commands.command(name="list", description="List all application positions.")
     async def list_positions(self, ctx: discord.ApplicationContext, page: int = 1):
         """List all application positions with pagination."""
-        positions = self.db.get_positions()
-        if not positions:
-            embed = discord.Embed(
-                title="No Application Positions",
-                description="There are currently no application positions defined.",
-                colour=discord.Color.orange()
-            )
-            await ctx.respond(embed=embed)
+        fields = await self._position_fields()
+        total = len(fields)
+        if not total:
+            await ctx.respond(embed=_EMBED_NO_POSITIONS.copy())
             return
 
         # Pagination settings
         per_page = 6  # number of positions per page
-        total = len(positions)
         total_pages = (total - 1) // per_page + 1
 
         # Validate requested page
         if page < 1 or page > total_pages:
-            embed = discord.Embed(
-                title="Page Not Found",
-                description=f"Page {page} is out of range. There {'is' if total_pages==1 else 'are'} {total_pages} page{'s' if total_pages!=1 else ''} available.",
-                colour=discord.Color.red()
-            )
-            await ctx.respond(embed=embed)
+            await _err(ctx, "Page Not Found", f"Page {page} is out of range. There {'is' if total_pages==1 else 'are'} {total_pages} page{'s' if total_pages!=1 else ''} available.", ephemeral=False)
             return
 
-        # Slice the positions for the requested page
         start = (page - 1) * per_page
-        end = start + per_page
-        page_positions = positions[start:end]
+        page_fields = fields[start:start + per_page]
 
         embed = discord.Embed(
             title="Application Positions",
-            colour=discord.Color.blue()
+            colour=_BLUE
         )
-        for pos in page_positions:
-            embed.add_field(
-                name=f"{pos['name'].title()}",
-                value=f"Description: {pos.get('description', 'No description provided.')}",
-                inline=False
-            )
+        for name, value in page_fields:
+            embed.add_field(name=name, value=value, inline=False)
 
         embed.set_footer(text=f"Page {page}/{total_pages} — {total} position{'s' if total!=1 else ''}")
         await ctx.respond(embed=embed)
@@ -309,32 +663,19 @@ class Applications(commands.Cog):
         (rather than all questions at once). The user's subsequent DM messages will
         be treated as answers to each question in turn.
         """
-        if self.db.is_user_blacklisted(ctx.author.id):
-            embed = discord.Embed(
-                title="Application Denied",
-                description="You are blacklisted from applying for positions.",
-                colour=discord.Color.red()
-            )
-            await ctx.respond(embed=embed, ephemeral=True)
+        if await self._db(self.db.is_user_blacklisted, ctx.author.id):
+            await _err(ctx, "Application Denied", "You are blacklisted from applying for positions.")
             return
 
-        # Normalize and look up by name (positions are stored lowercased by create)
-        lookup_name = position_name.lower()
-        position = self.db.get_position(lookup_name)
+        position = await self._position_or_respond(ctx, position_name, " Use `/application list` to see available positions.")
         if not position:
-            embed = discord.Embed(
-                title="Position Not Found",
-                description=f"No application position found with the name '{position_name}'. Use `/application list` to see available positions.",
-                colour=discord.Color.red()
-            )
-            await ctx.respond(embed=embed, ephemeral=True)
             return
 
         if not position.get('open', False):
             embed = discord.Embed(
                 title="Application Closed",
                 description=f"The application position '{position['name']}' (ID: {position['position_id']}) is currently closed for submissions.",
-                colour=discord.Color.orange()
+                colour=_ORANGE
             )
             await ctx.respond(embed=embed, ephemeral=True)
             return
@@ -342,19 +683,16 @@ class Applications(commands.Cog):
         # Start application process and send the first question only
         try:
             # Start the in-progress application using the resolved position_id
-            app_id = self.db.start_application(user_id=ctx.author.id, position_id=position['position_id'])
+            app_id = await self._db(self.db.start_application, user_id=ctx.author.id, position_id=position['position_id'])
+            self.invalidate_history()
+            self._active_users.add(ctx.author.id)
             questions = position.get('questions', [])
             if not questions:
                 # If there are no questions, inform the user and leave in-progress as empty; they can send a message to submit
                 try:
-                    await ctx.author.send(embed=discord.Embed(title=f"Application for '{position['name']}'", description="There are no questions for this application. Please send any additional information you want staff to see, or wait for staff to contact you.", colour=discord.Color.blue()))
+                    await ctx.author.send(embed=discord.Embed(title=f"Application for '{position['name']}'", description="There are no questions for this application. Please send any additional information you want staff to see, or wait for staff to contact you.", colour=_BLUE))
                 except discord.Forbidden:
-                    embed = discord.Embed(
-                        title="DM Failed",
-                        description="I was unable to send you a DM. Please ensure your privacy settings allow DMs from server members and try again.",
-                        colour=discord.Color.red()
-                    )
-                    await ctx.respond(embed=embed, ephemeral=True)
+                    await _err(ctx, "DM Failed", "I was unable to send you a DM. Please ensure your privacy settings allow DMs from server members and try again.")
                     return
             else:
                 # Send only the first question
@@ -362,33 +700,23 @@ class Applications(commands.Cog):
                 dm_embed = discord.Embed(
                     title=f"Application for '{position['name']}'",
                     description="You have initiated the application process. Please answer the following question. Reply in this DM with your answer; the bot will send the next question.",
-                    colour=discord.Color.blue()
+                    colour=_BLUE
                 )
                 dm_embed.add_field(name="Question 1", value=first_q, inline=False)
                 try:
                     await ctx.author.send(embed=dm_embed)
                 except discord.Forbidden:
-                    embed = discord.Embed(
-                        title="DM Failed",
-                        description="I was unable to send you a DM. Please ensure your privacy settings allow DMs from server members and try again.",
-                        colour=discord.Color.red()
-                    )
-                    await ctx.respond(embed=embed, ephemeral=True)
+                    await _err(ctx, "DM Failed", "I was unable to send you a DM. Please ensure your privacy settings allow DMs from server members and try again.")
                     return
 
             embed = discord.Embed(
                 title="Application Process Started",
                 description=(f"You have started the application process for '{position['name'].title()}'. Please check your DMs and reply with your answer to Question 1 — the bot will send the next question. You have 24 hours to complete the application."),
-                colour=discord.Color.green()
+                colour=_GREEN
             )
             await ctx.respond(embed=embed, ephemeral=True)
         except discord.Forbidden:
-            embed = discord.Embed(
-                title="DM Failed",
-                description="I was unable to send you a DM. Please ensure your privacy settings allow DMs from server members and try again.",
-                colour=discord.Color.red()
-            )
-            await ctx.respond(embed=embed, ephemeral=True)
+            await _err(ctx, "DM Failed", "I was unable to send you a DM. Please ensure your privacy settings allow DMs from server members and try again.")
             return
 
     @application_commands.command(name="withdraw", description="Withdraw your submitted application.")
@@ -396,89 +724,86 @@ class Applications(commands.Cog):
         """Withdraw a submitted application. If application_id is omitted, withdraw the user's latest submitted application."""
         # Determine target application
         if application_id is not None:
-            app = self.db.get_application(application_id)
+            app = await self._db(self.db.get_application, application_id)
             if not app:
-                embed = discord.Embed(title="Application Not Found", description=f"No application found with ID {application_id}.", colour=discord.Color.red())
-                await ctx.respond(embed=embed, ephemeral=True)
+                await _err(ctx, "Application Not Found", f"No application found with ID {application_id}.")
                 return
         else:
-            app = self.db.get_latest_submitted_application(ctx.author.id)
+            app = await self._db(self.db.get_latest_submitted_application, ctx.author.id)
             if not app:
-                embed = discord.Embed(title="No Submitted Application", description="You don't have any submitted applications to withdraw.", colour=discord.Color.orange())
-                await ctx.respond(embed=embed, ephemeral=True)
+                await ctx.respond(embed=_EMBED_NOTHING_TO_WITHDRAW.copy(), ephemeral=True)
                 return
 
         # Ownership check
         if app['user_id'] != ctx.author.id:
-            embed = discord.Embed(title="Permission Denied", description="You can only withdraw your own applications.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+            await _err(ctx, "Permission Denied", "You can only withdraw your own applications.")
             return
 
         # Status checks - only 'submitted' (or maybe 'pending') can be withdrawn
         status = app.get('status', '')
         if status == 'withdrawn':
-            embed = discord.Embed(title="Already Withdrawn", description=f"Application ID {app['application_id']} has already been withdrawn.", colour=discord.Color.orange())
+            embed = _TEMPLATE_ALREADY_WITHDRAWN.copy()
+            embed.description = f"Application ID {app['application_id']} has already been withdrawn."
             await ctx.respond(embed=embed, ephemeral=True)
             return
         if status in ('accepted', 'rejected'):
-            embed = discord.Embed(title="Cannot Withdraw", description=f"Application ID {app['application_id']} has already been processed and cannot be withdrawn.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+            await _err(ctx, "Cannot Withdraw", f"Application ID {app['application_id']} has already been processed and cannot be withdrawn.")
             return
 
         # Perform withdrawal
-        success = self.db.withdraw_application(app['application_id'])
+        success = await self._db(self.db.withdraw_application, app['application_id'])
         if not success:
-            embed = discord.Embed(title="Withdrawal Failed", description="Failed to withdraw the application. It may have already been withdrawn or does not exist.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+            await _err(ctx, "Withdrawal Failed", "Failed to withdraw the application. It may have already been withdrawn or does not exist.")
             return
+        self.invalidate_history()
 
-        embed = discord.Embed(title="Application Withdrawn", description=f"Your application (ID {app['application_id']}) has been withdrawn. Staff have been notified.", colour=discord.Color.green())
-        await ctx.respond(embed=embed, ephemeral=True)
+        embed = discord.Embed(title="Application Withdrawn", description=f"Your application (ID {app['application_id']}) has been withdrawn. Staff have been notified.", colour=_GREEN)
+        # The reply and the staff notice are independent, so send them together
+        await asyncio.gather(
+            ctx.respond(embed=embed, ephemeral=True),
+            self._notify_withdrawal(ctx.author, app),
+        )
 
-        # Optional: notify staff in the applications channel
+    async def _notify_withdrawal(self, author: discord.abc.User, app: dict) -> None:
+        """Post a withdrawal notice to the applications channel, if one is configured. Never raises."""
         try:
-            guild = None
-            if self.bot.guilds:
-                guild = self.bot.guilds[0]
+            guild = self._guild
             if guild:
-                channel_id = self.db.get_applications_channel(guild.id)
+                channel_id = await self._apps_channel_id(guild.id)
                 if channel_id:
                     channel = guild.get_channel(channel_id)
                     if channel:
-                        notif = discord.Embed(title="Application Withdrawn", colour=discord.Color.orange())
-                        notif.add_field(name="Applicant", value=f"{ctx.author} (ID: {ctx.author.id})", inline=False)
+                        notif = discord.Embed(title="Application Withdrawn", colour=_ORANGE)
+                        notif.add_field(name="Applicant", value=f"{author} (ID: {author.id})", inline=False)
                         notif.add_field(name="Application ID", value=str(app['application_id']), inline=True)
                         notif.add_field(name="Position ID", value=str(app['position_id']), inline=True)
                         await channel.send(embed=notif)
         except Exception:
             # Don't let notification failures block the command response
-            pass
+            logger.exception("Failed to post withdrawal notice to the applications channel")
 
     @application_commands.command(name="checkappstatus", description="Check the status of your submitted application.")
     async def check_app_status(self, ctx: discord.ApplicationContext, application_id: int = None):
         """Check the status of your submitted application. If application_id is omitted, checks the user's latest submitted application."""
         # Determine target application
         if application_id is not None:
-            app = self.db.get_application(application_id)
+            app = await self._db(self.db.get_application, application_id)
             if not app:
-                embed = discord.Embed(title="Application Not Found", description=f"No application found with ID {application_id}.", colour=discord.Color.red())
-                await ctx.respond(embed=embed, ephemeral=True)
+                await _err(ctx, "Application Not Found", f"No application found with ID {application_id}.")
                 return
         else:
-            app = self.db.get_latest_submitted_application(ctx.author.id)
+            app = await self._db(self.db.get_latest_submitted_application, ctx.author.id)
             if not app:
-                embed = discord.Embed(title="No Submitted Application", description="You don't have any submitted applications to check.", colour=discord.Color.orange())
-                await ctx.respond(embed=embed, ephemeral=True)
+                await ctx.respond(embed=_EMBED_NOTHING_TO_CHECK.copy(), ephemeral=True)
                 return
 
         # Ownership check
         if app['user_id'] != ctx.author.id:
-            embed = discord.Embed(title="Permission Denied", description="You can only check the status of your own applications.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+            await _err(ctx, "Permission Denied", "You can only check the status of your own applications.")
             return
 
         # Build status embed
-        embed = discord.Embed(title="Application Status", colour=discord.Color.blue())
+        embed = discord.Embed(title="Application Status", colour=_BLUE)
         embed.add_field(name="Application ID", value=str(app['application_id']), inline=True)
         embed.add_field(name="Position ID", value=str(app['position_id']), inline=True)
         embed.add_field(name="Status", value=app.get('status', 'unknown').capitalize(), inline=False)
@@ -488,135 +813,148 @@ class Applications(commands.Cog):
 
     # Application management commands
 
+    @staticmethod
+    def _atomic_swap(tmp_path: str, db_path: str) -> None:
+        """Replace the database at `db_path` with `tmp_path`, keeping a .bak of the old file.
+
+        Tries an atomic replace first; if that fails due to cross-device move (EXDEV on
+        POSIX or WinError 17 on Windows) falls back to copying the file. Blocking; run it
+        off the event loop.
+        """
+        backup_path = db_path + '.bak'
+        try:
+            if os.path.exists(db_path):
+                os.replace(db_path, backup_path)
+        except Exception as e:
+            # best-effort; ignore backup failures
+            logger.warning("Failed to backup temporary database file: %s", e)
+
+        try:
+            # Attempt atomic replace
+            os.replace(tmp_path, db_path)
+        except OSError as e_replace:
+            # Detect cross-device / different-filesystem error and fallback
+            is_exdev = False
+            if hasattr(e_replace, 'errno') and e_replace.errno == errno.EXDEV:
+                is_exdev = True
+            if hasattr(e_replace, 'winerror') and getattr(e_replace, 'winerror') == 17:
+                is_exdev = True
+
+            if is_exdev:
+                try:
+                    shutil.copy2(tmp_path, db_path)
+                    # remove the tmp file now it's copied
+                    try:
+                        os.remove(tmp_path)
+                    except Exception as e_remove:
+                        logger.warning("Failed to remove temporary uploaded database file after copy: %s", e_remove)
+                except Exception as e_copy:
+                    # Attempt to restore backup if copy failed
+                    try:
+                        if os.path.exists(backup_path):
+                            os.replace(backup_path, db_path)
+                    except Exception:
+                        logger.exception("Failed to restore database from backup after failed copy")
+                    raise e_copy from e_replace
+            else:
+                # Not a cross-device error - re-raise to the caller
+                raise
+
+    def _replace_database(self, tmp_path: str) -> None:
+        """Swap in a new database file with the database connection closed, so no open
+        connection or WAL file still refers to the old one. Blocking.
+        """
+        with self.db.detached():
+            self._atomic_swap(tmp_path, self.db.db_path)
+        # The uploaded file may predate the current indexes and casefolded position names;
+        # initialization is idempotent and adds both
+        self.db._initialize_database()
+
     @perms_util.has_permission("manage_applications")
     @appsmanage_commands.command(name="get_file", description="Provides a copy of the applications database file.")
     async def get_file(self, ctx: discord.ApplicationContext):
         """Provides a copy of the applications database file."""
-        db_path = self.db.db_path
+        fd, tmp_path = tempfile.mkstemp(prefix="applications_backup_", suffix=".db")
+        os.close(fd)
         try:
-            await ctx.respond("Here is the applications database file:", file=discord.File(db_path))
+            # Send a snapshot taken with the backup API; the live file can lag behind its WAL
+            await asyncio.to_thread(self.db.backup_to, tmp_path)
+            # discord.File opens the file synchronously
+            db_file = await asyncio.to_thread(discord.File, tmp_path, filename=os.path.basename(self.db.db_path))
+            await ctx.respond("Here is the applications database file:", file=db_file)
         except Exception as e:
-            embed = discord.Embed(
-                title="Failed to Send Database",
-                description=f"An error occurred while sending the database file: {e}",
-                colour=discord.Color.red()
-            )
-            await ctx.respond(embed=embed)
+            await _err(ctx, "Failed to Send Database", f"An error occurred while sending the database file: {e}", ephemeral=False)
+        finally:
+            try:
+                await aiofiles.os.remove(tmp_path)
+            except OSError as e:
+                logger.warning("Failed to remove temporary database backup: %s", e)
 
     @perms_util.has_permission("manage_applications")
     @appsmanage_commands.command(name="put_file", description="Replace the applications database with an uploaded file.")
     async def put_file(self, ctx: discord.ApplicationContext, file: discord.Attachment):
         """Replace the applications database with an uploaded file."""
         if not file.filename.endswith('.db'):
-            embed = discord.Embed(
-                title="Invalid File",
-                description="The uploaded file must be a .db file.",
-                colour=discord.Color.red()
-            )
-            await ctx.respond(embed=embed)
+            await _err(ctx, "Invalid File", "The uploaded file must be a .db file.", ephemeral=False)
             return
 
+        # Stream the file into a temporary path first, so the whole upload is never held in memory
+        tmp_dir = tempfile.gettempdir()
+        tmp_path = os.path.join(tmp_dir, f"uploaded_applications_{int(time.time())}.db")
         try:
-            # Download the file into a temporary path first
-            file_bytes = await file.read()
-            tmp_dir = tempfile.gettempdir()
-            tmp_path = os.path.join(tmp_dir, f"uploaded_applications_{int(time.time())}.db")
-            with open(tmp_path, 'wb') as f:
-                f.write(file_bytes)
+            async with aiohttp.ClientSession() as session:
+                async with session.get(file.url) as resp:
+                    resp.raise_for_status()
+                    async with aiofiles.open(tmp_path, 'wb') as f:
+                        async for chunk in resp.content.iter_chunked(_UPLOAD_CHUNK_SIZE):
+                            await f.write(chunk)
 
             # Validate schema before replacing the live database
-            valid, reason = self.db.is_valid_database(tmp_path)
+            valid, reason = await asyncio.to_thread(self.db.is_valid_database, tmp_path)
             if not valid:
-                # Remove temp file and report
-                try:
-                    os.remove(tmp_path)
-                except Exception as e:
-                    print("Warning: failed to remove temporary uploaded database file.", e)
-                embed = discord.Embed(
-                    title="Invalid Database",
-                    description=f"The uploaded database does not match the required schema: {reason}",
-                    colour=discord.Color.red()
-                )
-                await ctx.respond(embed=embed)
+                await _err(ctx, "Invalid Database", f"The uploaded database does not match the required schema: {reason}", ephemeral=False)
                 return
 
-            # Replace the live database file. Try atomic replace first; if that
-            # fails due to cross-device move (EXDEV on POSIX or WinError 17 on
-            # Windows) fall back to copying the file.
+            # Replace the live database file off the event loop (see _atomic_swap)
             try:
-                backup_path = self.db.db_path + '.bak'
-                try:
-                    if os.path.exists(self.db.db_path):
-                        os.replace(self.db.db_path, backup_path)
-                except Exception as e:
-                    # best-effort; ignore backup failures
-                    print("Warning: failed to backup temporary database file.", e)
-
-                try:
-                    # Attempt atomic replace
-                    os.replace(tmp_path, self.db.db_path)
-                except OSError as e_replace:
-                    # Detect cross-device / different-filesystem error and fallback
-                    import errno, shutil
-                    is_exdev = False
-                    if hasattr(e_replace, 'errno') and e_replace.errno == errno.EXDEV:
-                        is_exdev = True
-                    if hasattr(e_replace, 'winerror') and getattr(e_replace, 'winerror') == 17:
-                        is_exdev = True
-
-                    if is_exdev:
-                        try:
-                            shutil.copy2(tmp_path, self.db.db_path)
-                            # remove the tmp file now it's copied
-                            try:
-                                os.remove(tmp_path)
-                            except Exception as e_remove:
-                                print("Warning: failed to remove temporary uploaded database file after copy.", e_remove)
-                        except Exception as e_copy:
-                            # Attempt to restore backup if copy failed
-                            try:
-                                if os.path.exists(backup_path):
-                                    os.replace(backup_path, self.db.db_path)
-                            except Exception as e_restore:
-                                print("Warning: failed to restore database from backup after failed copy.", e_restore)
-                            raise e_copy from e_replace
-                    else:
-                        # Not a cross-device error - re-raise to be handled below
-                        raise
+                await asyncio.to_thread(self._replace_database, tmp_path)
             except Exception as e:
-                print("Error replacing database file:", e)
-                embed = discord.Embed(
-                    title="Failed to Replace Database",
-                    description=f"An error occurred while replacing the database file: {e}",
-                    colour=discord.Color.red()
-                )
-                await ctx.respond(embed=embed)
+                logger.exception("Error replacing database file")
+                await _err(ctx, "Failed to Replace Database", f"An error occurred while replacing the database file: {e}", ephemeral=False)
                 return
 
+            # Every cached lookup came from the old database
+            self.cache_clear()
+            self._active_users = await self._db(self.db.get_in_progress_user_ids)
             embed = discord.Embed(
                 title="Database Replaced",
                 description="The applications database has been successfully replaced with the uploaded file.",
-                colour=discord.Color.green()
+                colour=_GREEN
             )
             await ctx.respond(embed=embed)
         except Exception as e:
-            print("Error processing uploaded database file:", e)
-            embed = discord.Embed(
-                title="Failed to Replace Database",
-                description=f"An error occurred while replacing the database file: {e}",
-                colour=discord.Color.red()
-            )
-            await ctx.respond(embed=embed)
+            logger.exception("Error processing uploaded database file")
+            await _err(ctx, "Failed to Replace Database", f"An error occurred while replacing the database file: {e}", ephemeral=False)
+        finally:
+            # A successful swap moves the file into place; anything left is a partial or rejected upload
+            try:
+                await aiofiles.os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Failed to remove temporary uploaded database file: %s", e)
 
     @perms_util.has_permission("set_apps_channel")
     @appsmanage_commands.command(name="set_apps_channel", description="Set the channel for application submissions.")
     async def set_apps_channel(self, ctx: discord.ApplicationContext, channel: discord.TextChannel):
         """Set the channel for application submissions."""
-        self.db.set_applications_channel(ctx.guild.id, channel.id)
+        await self._db(self.db.set_applications_channel, ctx.guild.id, channel.id)
+        # Write through so the next lookup needs no query
+        self._chan_cache[ctx.guild.id] = (time.monotonic(), channel.id)
         embed = discord.Embed(
             title="Application Channel Set",
             description=f"Application submissions channel set to {channel.mention}.",
-            colour=discord.Color.green()
+            colour=_GREEN
         )
         await ctx.respond(embed=embed)
 
@@ -624,26 +962,26 @@ class Applications(commands.Cog):
     @appsmanage_commands.command(name="get_apps_channel", description="List the current application submissions channel.")
     async def get_apps_channel(self, ctx: discord.ApplicationContext):
         """List the current application submissions channel."""
-        channel_id = self.db.get_applications_channel(ctx.guild.id)
+        channel_id = await self._apps_channel_id(ctx.guild.id)
         if channel_id:
             channel = ctx.guild.get_channel(channel_id)
             if channel:
                 embed = discord.Embed(
                     title="Current Application Channel",
                     description=f"The current application submissions channel is {channel.mention}.",
-                    colour=discord.Color.green()
+                    colour=_GREEN
                 )
             else:
                 embed = discord.Embed(
                     title="Current Application Channel",
                     description=f"The application submissions channel is set to an invalid channel (ID: {channel_id}).",
-                    colour=discord.Color.red()
+                    colour=_RED
                 )
         else:
             embed = discord.Embed(
                 title="Current Application Channel",
                 description="No application submissions channel has been set.",
-                colour=discord.Color.orange()
+                colour=_ORANGE
             )
         await ctx.respond(embed=embed)
 
@@ -653,60 +991,37 @@ class Applications(commands.Cog):
         """Create a new application position.
         Allows identical names, but it's not recommended."""
         # Enforce unique position names (case-insensitive).
-        application_name = application_name.lower()
-        existing_positions = self.db.get_position(application_name)
+        application_name = application_name.strip().casefold()
+        existing_positions = await self._db(self.db.get_position, application_name)
         if existing_positions:
-            embed = discord.Embed(
-                title="Creation Failed",
-                description=f"An application position with the name '{application_name}' already exists. Choose a unique name.",
-                colour=discord.Color.red()
-            )
-            await ctx.respond(embed=embed, ephemeral=True)
+            await _err(ctx, "Creation Failed", f"An application position with the name '{application_name}' already exists. Choose a unique name.")
             return
 
         # Add position to database and get its ID
-        position_id = self.db.add_position(application_name)
+        position_id = await self._db(self.db.add_position, application_name)
+        self._positions_cache = None
         embed = discord.Embed(
             title="Application Created",
             description=f"Application position '{application_name}' created with ID {position_id}.",
-            colour=discord.Color.green()
+            colour=_GREEN
         )
         await ctx.respond(embed=embed)
 
     @perms_util.has_permission("manage_roles")
     @appsmanage_commands.command(name="delete", description="Delete an existing application position.")
     async def delete(self, ctx: discord.ApplicationContext, application_name: str):
-        """Delete an existing application position by name. If multiple positions share the name, the command will ask you to disambiguate by ID."""
-        lookup_name = application_name.lower()
-        positions = self.db.get_position(lookup_name)
-        if not positions:
-            embed = discord.Embed(
-                title="Position Not Found",
-                description=f"No application position found with the name '{application_name}'.",
-                colour=discord.Color.red()
-            )
-            await ctx.respond(embed=embed)
-            return
-
-        if len(positions) > 1:
-            # Ambiguous — ask the invoker to use the ID to delete
-            duplicate_list = '\n'.join([f"ID {p['position_id']} — {p['name']}" for p in positions])
-            embed = discord.Embed(
-                title="Multiple Positions Found",
-                description=(f"Multiple positions match the name '{application_name}'. Please re-run this command using the position's ID to delete the intended one.\n\n{duplicate_list}"),
-                colour=discord.Color.orange()
-            )
-            await ctx.respond(embed=embed)
+        """Delete an existing application position by name (names are unique, see create)."""
+        position = await self._position_or_respond(ctx, application_name, ephemeral=False)
+        if not position:
             return
-
-        position = positions[0]
         position_id = position['position_id']
 
-        self.db.remove_position(position_id)
+        await self._db(self.db.remove_position, position_id)
+        self._positions_cache = None
         embed = discord.Embed(
             title="Application Deleted",
             description=f"Application position '{position['name']}' (ID: {position_id}) has been deleted.",
-            colour=discord.Color.green()
+            colour=_GREEN
         )
         await ctx.respond(embed=embed)
 
@@ -715,39 +1030,45 @@ class Applications(commands.Cog):
     @appsmanage_commands.command(name="approve", description="Approve an application, notify the applicant, and assign configured roles.")
     async def approve(self, ctx: discord.ApplicationContext, application_id: int):
         """Approve a submitted application by ID: set status to 'accepted', assign roles, DM the applicant, and log to the applications channel."""
-        # Fetch the application
-        app = self.db.get_application(application_id)
+        # Fetch the application, its position and the applications channel in one query
+        guild = ctx.guild or self._guild
+        app = await self._db(self.db.get_approval_bundle, application_id, guild.id if guild else None)
         if not app:
-            embed = discord.Embed(title="Application Not Found", description=f"No application found with ID {application_id}.", colour=discord.Color.red())
+            embed = _TEMPLATE_NOT_FOUND.copy()
+            embed.description = f"No application found with ID {application_id}."
             await ctx.respond(embed=embed, ephemeral=True)
             return
 
         # Only allow approving submitted applications
         status = app.get('status', '')
         if status in ('accepted', 'rejected', 'withdrawn'):
-            embed = discord.Embed(title="Already Processed", description=f"Application ID {application_id} has status '{status}' and cannot be approved.", colour=discord.Color.orange())
+            embed = _TEMPLATE_ALREADY_PROCESSED.copy()
+            embed.description = f"Application ID {application_id} has status '{status}' and cannot be approved."
             await ctx.respond(embed=embed, ephemeral=True)
             return
 
+        # Resolve the applicant's member object while the status is written
+        user_id = app['user_id']
+        member_task = asyncio.create_task(self._resolve_member(guild, user_id))
+
         # Update DB status first
-        updated = self.db.set_application_status(application_id, 'accepted')
+        try:
+            updated = await self._db(self.db.decide_application, application_id, 'accepted')
+        except BaseException:
+            member_task.cancel()
+            raise
         if not updated:
-            embed = discord.Embed(title="Failed to Update", description="Failed to mark the application as accepted. It may have been processed already.", colour=discord.Color.red())
+            member_task.cancel()
+            embed = _TEMPLATE_UPDATE_FAILED.copy()
+            embed.description = "Failed to mark the application as accepted. It may have been processed already."
             await ctx.respond(embed=embed, ephemeral=True)
             return
+        self.invalidate_history()
 
         # Gather position info and target user
-        position = self.db.get_position(app['position_id'])
+        position = app['position']
         position_name = position['name'] if position else f"ID {app['position_id']}"
-        user_id = app['user_id']
-
-        # Try to find the member in the guild
-        member = ctx.guild.get_member(user_id) if ctx.guild else None
-        if member is None:
-            try:
-                member = await ctx.guild.fetch_member(user_id)
-            except Exception:
-                member = None
+        member = await member_task
 
         roles_assigned = []
         roles_failed = []
@@ -756,22 +1077,14 @@ class Applications(commands.Cog):
         roles_to_give = position.get('roles_given', []) if position else []
         if member and roles_to_give:
             # Resolve Role objects and filter out any that the bot cannot assign
-            bot_member = ctx.guild.me
-            assignable = []
-            for rid in roles_to_give:
-                role = ctx.guild.get_role(rid)
-                if not role:
-                    roles_failed.append((rid, 'role_not_found'))
-                    continue
-                # Check role hierarchy: bot must be higher than the role to assign it
-                try:
-                    if bot_member and role.position >= bot_member.top_role.position:
-                        roles_failed.append((rid, 'role_above_bot'))
-                        continue
-                except Exception:
-                    # If we cannot determine positions, attempt assignment and catch exceptions
-                    pass
-                assignable.append(role)
+            # (the bot's top role must be higher than the role to assign it)
+            bot_member = guild.me
+            bot_top_pos = bot_member.top_role.position if bot_member else None
+            get_role = guild.get_role
+            resolved = [(rid, get_role(rid)) for rid in roles_to_give]
+            assignable = [r for _, r in resolved if r and (bot_top_pos is None or r.position < bot_top_pos)]
+            roles_failed = [(rid, 'role_not_found' if r is None else 'role_above_bot')
+                            for rid, r in resolved if r is None or (bot_top_pos is not None and r.position >= bot_top_pos)]
 
             if assignable:
                 try:
@@ -779,85 +1092,56 @@ class Applications(commands.Cog):
                     roles_assigned = [r.id for r in assignable]
                 except discord.Forbidden:
                     # Permission error assigning roles
-                    for r in assignable:
-                        roles_failed.append((r.id, 'forbidden'))
+                    roles_failed.extend((r.id, 'forbidden') for r in assignable)
                 except Exception:
-                    for r in assignable:
-                        roles_failed.append((r.id, 'failed'))
+                    roles_failed.extend((r.id, 'failed') for r in assignable)
+
+        # Role summaries shared by the public embed and the staff summary
+        assigned_mentions = ", ".join(map("<@&{}>".format, roles_assigned))
+        failed_mentions = ", ".join(f"{rid} ({why})" for rid, why in roles_failed)
 
         # Prepare acceptance message
         acceptance_message = position.get('acceptance_message') if position else None
-        dm_sent = False
-        dm_failed = False
-        dm_error = None
         # Build an embed for the DM or channel post
-        acceptance_embed = discord.Embed(title="Application Approved", colour=discord.Color.green())
+        acceptance_embed = _TEMPLATE_APPROVED.copy()
         acceptance_embed.add_field(name="Position", value=position_name, inline=False)
         acceptance_embed.add_field(name="Application ID", value=str(application_id), inline=True)
         acceptance_embed.add_field(name="Staff", value=f"{ctx.author}", inline=True)
         if acceptance_message:
             acceptance_embed.add_field(name="Message", value=acceptance_message, inline=False)
 
-        # Try to DM the user
-        try:
-            if member:
-                await member.send(embed=acceptance_embed)
-                dm_sent = True
-            else:
-                # Try to DM by user id via user object
-                user = await self.bot.fetch_user(user_id)
-                if user:
-                    await user.send(embed=acceptance_embed)
-                    dm_sent = True
-        except discord.Forbidden as e:
-            dm_failed = True
-            dm_error = 'forbidden'
-        except Exception as e:
-            dm_failed = True
-            dm_error = 'failed'
+        # Build the public embed up front so a failed DM falls through to the channel immediately
+        public_embed = _TEMPLATE_APPROVED.copy()
+        public_embed.add_field(name="Applicant", value=f"<@{user_id}> (ID: {user_id})", inline=False)
+        public_embed.add_field(name="Position", value=position_name, inline=True)
+        public_embed.add_field(name="Application ID", value=str(application_id), inline=True)
+        public_embed.add_field(name="Staff", value=f"{ctx.author}", inline=True)
+        if acceptance_message:
+            public_embed.add_field(name="Message", value=acceptance_message, inline=False)
+        if roles_assigned:
+            public_embed.add_field(name="Roles Assigned", value=assigned_mentions, inline=False)
+        if roles_failed:
+            public_embed.add_field(name="Role Assignment Failures", value=failed_mentions, inline=False)
 
-        # If DM failed, attempt to post in the applications channel
-        apps_channel_posted = False
-        try:
-            guild = ctx.guild if ctx.guild else (self.bot.guilds[0] if self.bot.guilds else None)
-            if (not dm_sent) and guild:
-                channel_id = self.db.get_applications_channel(guild.id)
-                if channel_id:
-                    channel = guild.get_channel(channel_id)
-                    if channel:
-                        # Build a public embed that mentions the user
-                        public_embed = discord.Embed(title="Application Approved", colour=discord.Color.green())
-                        public_embed.add_field(name="Applicant", value=f"<@{user_id}> (ID: {user_id})", inline=False)
-                        public_embed.add_field(name="Position", value=position_name, inline=True)
-                        public_embed.add_field(name="Application ID", value=str(application_id), inline=True)
-                        public_embed.add_field(name="Staff", value=f"{ctx.author}", inline=True)
-                        if acceptance_message:
-                            public_embed.add_field(name="Message", value=acceptance_message, inline=False)
-                        if roles_assigned:
-                            public_embed.add_field(name="Roles Assigned", value=", ".join([f"<@&{r}>" for r in roles_assigned]), inline=False)
-                        if roles_failed:
-                            public_embed.add_field(name="Role Assignment Failures", value=", ".join([f"{t[0]} ({t[1]})" for t in roles_failed]), inline=False)
-                        await channel.send(embed=public_embed)
-                        apps_channel_posted = True
-        except Exception:
-            # Don't let logging failures block the command
-            pass
+        # DM the user, or post in the applications channel if that fails
+        channel = guild.get_channel(app['channel_id']) if guild and app['channel_id'] else None
+        dm_sent, dm_error, apps_channel_queued = await self._notify_decision(member, user_id, acceptance_embed, public_embed, channel)
 
         # Build response for the invoking staff
-        summary = discord.Embed(title="Application Approved", colour=discord.Color.green())
+        summary = _TEMPLATE_APPROVED.copy()
         summary.add_field(name="Application ID", value=str(application_id), inline=True)
         summary.add_field(name="Applicant", value=f"<@{user_id}>", inline=True)
         summary.add_field(name="Position", value=position_name, inline=True)
         if roles_assigned:
-            summary.add_field(name="Roles Assigned", value=", ".join([f"<@&{r}>" for r in roles_assigned]), inline=False)
+            summary.add_field(name="Roles Assigned", value=assigned_mentions, inline=False)
         if roles_failed:
-            summary.add_field(name="Role Assignment Failures", value=", ".join([f"{t[0]} ({t[1]})" for t in roles_failed]), inline=False)
+            summary.add_field(name="Role Assignment Failures", value=failed_mentions, inline=False)
         if dm_sent:
             summary.add_field(name="DM", value="Sent to applicant.", inline=True)
-        elif dm_failed:
+        elif dm_error:
             summary.add_field(name="DM", value=f"Failed to send DM ({dm_error}).", inline=True)
-        if apps_channel_posted:
-            summary.add_field(name="Posted to Applications Channel", value="Yes", inline=True)
+        if apps_channel_queued:
+            summary.add_field(name="Posted to Applications Channel", value="Queued", inline=True)
 
         await ctx.respond(embed=summary)
 
@@ -865,103 +1149,81 @@ class Applications(commands.Cog):
     @appsmanage_commands.command(name="reject", description="Reject an application, notify the applicant, and log the rejection.")
     async def reject(self, ctx: discord.ApplicationContext, application_id: int, *, reason: str = None):
         """Reject a submitted application by ID: set status to 'rejected', DM the applicant with rejection_message or provided reason, and log to the applications channel."""
-        # Fetch the application
-        app = self.db.get_application(application_id)
+        # Fetch the application, its position and the applications channel in one query
+        guild = ctx.guild or self._guild
+        app = await self._db(self.db.get_approval_bundle, application_id, guild.id if guild else None)
         if not app:
-            embed = discord.Embed(title="Application Not Found", description=f"No application found with ID {application_id}.", colour=discord.Color.red())
+            embed = _TEMPLATE_NOT_FOUND.copy()
+            embed.description = f"No application found with ID {application_id}."
             await ctx.respond(embed=embed, ephemeral=True)
             return
 
         # Only allow rejecting submitted applications
         status = app.get('status', '')
         if status in ('accepted', 'rejected', 'withdrawn'):
-            embed = discord.Embed(title="Already Processed", description=f"Application ID {application_id} has status '{status}' and cannot be rejected.", colour=discord.Color.orange())
+            embed = _TEMPLATE_ALREADY_PROCESSED.copy()
+            embed.description = f"Application ID {application_id} has status '{status}' and cannot be rejected."
             await ctx.respond(embed=embed, ephemeral=True)
             return
 
+        # Resolve the applicant's member object while the status is written
+        user_id = app['user_id']
+        member_task = asyncio.create_task(self._resolve_member(guild, user_id))
+
         # Update DB status to rejected
-        updated = self.db.set_application_status(application_id, 'rejected')
+        try:
+            updated = await self._db(self.db.decide_application, application_id, 'rejected')
+        except BaseException:
+            member_task.cancel()
+            raise
         if not updated:
-            embed = discord.Embed(title="Failed to Update", description="Failed to mark the application as rejected. It may have been processed already.", colour=discord.Color.red())
+            member_task.cancel()
+            embed = _TEMPLATE_UPDATE_FAILED.copy()
+            embed.description = "Failed to mark the application as rejected. It may have been processed already."
             await ctx.respond(embed=embed, ephemeral=True)
             return
+        self.invalidate_history()
 
         # Gather position info and target user
-        position = self.db.get_position(app['position_id'])
+        position = app['position']
         position_name = position['name'] if position else f"ID {app['position_id']}"
-        user_id = app['user_id']
-
-        # Try to find the member in the guild
-        member = ctx.guild.get_member(user_id) if ctx.guild else None
-        if member is None:
-            try:
-                member = await ctx.guild.fetch_member(user_id)
-            except Exception:
-                member = None
+        member = await member_task
 
         # Prepare rejection message
         rejection_message = reason or (position.get('rejection_message') if position else None)
-        dm_sent = False
-        dm_failed = False
-        dm_error = None
-        rejection_embed = discord.Embed(title="Application Rejected", colour=discord.Color.red())
+        # Truncated once for both the DM and the public embed
+        truncated = _truncate(rejection_message) if rejection_message else None
+        rejection_embed = _TEMPLATE_REJECTED.copy()
         rejection_embed.add_field(name="Position", value=position_name, inline=False)
         rejection_embed.add_field(name="Application ID", value=str(application_id), inline=True)
         rejection_embed.add_field(name="Staff", value=f"{ctx.author}", inline=True)
-        if rejection_message:
-            truncated = (rejection_message[:1900] + '...') if len(rejection_message) > 1900 else rejection_message
+        if truncated:
             rejection_embed.add_field(name="Reason", value=truncated, inline=False)
 
-        # Try to DM the user
-        try:
-            if member:
-                await member.send(embed=rejection_embed)
-                dm_sent = True
-            else:
-                user = await self.bot.fetch_user(user_id)
-                if user:
-                    await user.send(embed=rejection_embed)
-                    dm_sent = True
-        except discord.Forbidden:
-            dm_failed = True
-            dm_error = 'forbidden'
-        except Exception:
-            dm_failed = True
-            dm_error = 'failed'
+        # Build the public embed up front so a failed DM falls through to the channel immediately
+        public_embed = _TEMPLATE_REJECTED.copy()
+        public_embed.add_field(name="Applicant", value=f"<@{user_id}> (ID: {user_id})", inline=False)
+        public_embed.add_field(name="Position", value=position_name, inline=True)
+        public_embed.add_field(name="Application ID", value=str(application_id), inline=True)
+        public_embed.add_field(name="Staff", value=f"{ctx.author}", inline=True)
+        if truncated:
+            public_embed.add_field(name="Reason", value=truncated, inline=False)
 
-        # If DM failed, attempt to post in the applications channel
-        apps_channel_posted = False
-        try:
-            guild = ctx.guild if ctx.guild else (self.bot.guilds[0] if self.bot.guilds else None)
-            if (not dm_sent) and guild:
-                channel_id = self.db.get_applications_channel(guild.id)
-                if channel_id:
-                    channel = guild.get_channel(channel_id)
-                    if channel:
-                        public_embed = discord.Embed(title="Application Rejected", colour=discord.Color.red())
-                        public_embed.add_field(name="Applicant", value=f"<@{user_id}> (ID: {user_id})", inline=False)
-                        public_embed.add_field(name="Position", value=position_name, inline=True)
-                        public_embed.add_field(name="Application ID", value=str(application_id), inline=True)
-                        public_embed.add_field(name="Staff", value=f"{ctx.author}", inline=True)
-                        if rejection_message:
-                            public_embed.add_field(name="Reason", value=rejection_message, inline=False)
-                        await channel.send(embed=public_embed)
-                        apps_channel_posted = True
-        except Exception:
-            # Don't let logging failures block the command
-            pass
+        # DM the user, or post in the applications channel if that fails
+        channel = guild.get_channel(app['channel_id']) if guild and app['channel_id'] else None
+        dm_sent, dm_error, apps_channel_queued = await self._notify_decision(member, user_id, rejection_embed, public_embed, channel)
 
         # Build response for the invoking staff
-        summary = discord.Embed(title="Application Rejected", colour=discord.Color.red())
+        summary = _TEMPLATE_REJECTED.copy()
         summary.add_field(name="Application ID", value=str(application_id), inline=True)
         summary.add_field(name="Applicant", value=f"<@{user_id}>", inline=True)
         summary.add_field(name="Position", value=position_name, inline=True)
         if dm_sent:
             summary.add_field(name="DM", value="Sent to applicant.", inline=True)
-        elif dm_failed:
+        elif dm_error:
             summary.add_field(name="DM", value=f"Failed to send DM ({dm_error}).", inline=True)
-        if apps_channel_posted:
-            summary.add_field(name="Posted to Applications Channel", value="Yes", inline=True)
+        if apps_channel_queued:
+            summary.add_field(name="Posted to Applications Channel", value="Queued", inline=True)
 
         await ctx.respond(embed=summary)
 
@@ -972,130 +1234,104 @@ class Applications(commands.Cog):
 
         If status is 'On Hold', also posts: "Application <ID> has been placed on hold by <Staff>." to the apps channel (if configured).
         """
-        # Normalize input and map to DB statuses (preserve existing 'rejected' value used elsewhere)
-        mapping = {
-            'pending': 'pending',
-            'under review': 'under_review',
-            'under_review': 'under_review',
-            'accepted': 'accepted',
-            'denied': 'rejected',
-            'rejected': 'rejected',
-            'withdrawn': 'withdrawn',
-            'flagged': 'flagged',
-            'on hold': 'on_hold',
-            'on_hold': 'on_hold'
-        }
-
-        key = status.lower().strip()
-        db_status = mapping.get(key)
+        # Normalize input and map to DB statuses
+        db_status = _STATUS_MAPPING.get(status.casefold().strip())
         if not db_status:
-            embed = discord.Embed(
-                title="Invalid Status",
-                description=("Status must be one of: Pending, Under Review, Accepted, Denied, Withdrawn, Flagged, On Hold."),
-                colour=discord.Color.red()
-            )
-            await ctx.respond(embed=embed, ephemeral=True)
+            await _err(ctx, "Invalid Status", "Status must be one of: Pending, Under Review, Accepted, Denied, Withdrawn, Flagged, On Hold.")
             return
 
         # Fetch application
-        app = self.db.get_application(application_id)
+        app = await self._db(self.db.get_application, application_id)
         if not app:
-            embed = discord.Embed(title="Application Not Found", description=f"No application found with ID {application_id}.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+            await _err(ctx, "Application Not Found", f"No application found with ID {application_id}.")
             return
 
         # If status already matches, inform the invoker
         current = app.get('status', '')
         if current == db_status:
-            embed = discord.Embed(title="No Change", description=f"Application {application_id} already has status '{status}'.", colour=discord.Color.orange())
+            embed = discord.Embed(title="No Change", description=f"Application {application_id} already has status '{status}'.", colour=_ORANGE)
             await ctx.respond(embed=embed, ephemeral=True)
             return
 
         # Update DB
-        updated = self.db.set_application_status(application_id, db_status)
+        updated = await self._write(self.db.set_application_status, application_id, db_status)
         if not updated:
             # set_application_status returns False if row not found or status identical; we already checked identical, so treat as failure
-            embed = discord.Embed(title="Update Failed", description="Failed to update the application's status. It may have been processed already.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+            await _err(ctx, "Update Failed", "Failed to update the application's status. It may have been processed already.")
             return
 
+        # Confirmation for the staff invoker
+        pretty = status.title()
+        embed = discord.Embed(title="Status Updated", description=f"Application {application_id} status set to {pretty}.", colour=_GREEN)
+        embed.add_field(name="New Status", value=pretty, inline=True)
+        embed.add_field(name="Application ID", value=str(application_id), inline=True)
+
         # Special behavior for On Hold: post the short message to the apps channel
+        channel = None
         if db_status == 'on_hold':
             try:
-                guild = ctx.guild if ctx.guild else (self.bot.guilds[0] if self.bot.guilds else None)
+                guild = ctx.guild or self._guild
                 if guild:
-                    channel_id = self.db.get_applications_channel(guild.id)
+                    channel_id = await self._apps_channel_id(guild.id)
                     if channel_id:
                         channel = guild.get_channel(channel_id)
-                        if channel:
-                            # Exact message requested by user
-                            msg = f"Application {application_id} has been placed on hold by {ctx.author.mention}."
-                            await channel.send(msg)
             except Exception:
-                # Don't let logging/posting failures block the command response
-                pass
+                # Don't let lookup failures block the command response
+                logger.exception("Failed to look up the applications channel for the on-hold notice")
+                channel = None
 
-        # Respond to staff invoker with confirmation
-        pretty = status.title()
-        embed = discord.Embed(title="Status Updated", description=f"Application {application_id} status set to {pretty}.", colour=discord.Color.green())
-        embed.add_field(name="New Status", value=pretty, inline=True)
-        embed.add_field(name="Application ID", value=str(application_id), inline=True)
-        await ctx.respond(embed=embed, ephemeral=True)
+        if channel is None:
+            await ctx.respond(embed=embed, ephemeral=True)
+            return
+
+        # Post to the channel and respond concurrently; a failed post must not block the response
+        msg = f"Application {application_id} has been placed on hold by {ctx.author.mention}."
+        posted, responded = await asyncio.gather(channel.send(msg), ctx.respond(embed=embed, ephemeral=True), return_exceptions=True)
+        if isinstance(posted, BaseException):
+            logger.warning("Failed to post the on-hold notice for application %s: %s", application_id, posted)
+        if isinstance(responded, BaseException):
+            raise responded
 
     @perms_util.has_permission("manage_applications")
     @appsmanage_commands.command(name="flag_app", description="Flag an application, preventing further action until unflagged.")
     async def flag_application(self, ctx: discord.ApplicationContext, application_id: int):
         """Flag an application as needing attention. This sets the status to 'flagged' and prevents acceptance/rejection until unflagged."""
-        # Fetch the application
-        app = self.db.get_application(application_id)
-        if not app:
-            embed = discord.Embed(title="Application Not Found", description=f"No application found with ID {application_id}.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
-            return
-
-        # Only allow flagging submitted applications
-        status = app.get('status', '')
-        if status == 'flagged':
-            embed = discord.Embed(title="Already Flagged", description=f"Application ID {application_id} is already flagged.", colour=discord.Color.orange())
-            await ctx.respond(embed=embed, ephemeral=True)
-            return
-
-        # Update DB status to flagged
-        updated = self.db.set_application_status(application_id, 'flagged')
+        # Update DB status to flagged; the write is skipped if it is already flagged
+        updated = await self._write(self.db.set_application_status, application_id, 'flagged')
         if not updated:
-            embed = discord.Embed(title="Failed to Update", description="Failed to flag the application. It may have been processed already.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+            # Only read the application back to explain why nothing changed
+            app = await self._db(self.db.get_application, application_id)
+            if not app:
+                await _err(ctx, "Application Not Found", f"No application found with ID {application_id}.")
+            elif app.get('status') == 'flagged':
+                embed = discord.Embed(title="Already Flagged", description=f"Application ID {application_id} is already flagged.", colour=_ORANGE)
+                await ctx.respond(embed=embed, ephemeral=True)
+            else:
+                await _err(ctx, "Failed to Update", "Failed to flag the application. It may have been processed already.")
             return
 
-        embed = discord.Embed(title="Application Flagged", description=f"Application ID {application_id} has been flagged. It cannot be processed further until unflagged.", colour=discord.Color.green())
+        embed = discord.Embed(title="Application Flagged", description=f"Application ID {application_id} has been flagged. It cannot be processed further until unflagged.", colour=_GREEN)
         await ctx.respond(embed=embed, ephemeral=True)
 
     @perms_util.has_permission("manage_applications")
     @appsmanage_commands.command(name="unflag_app", description="Unflag a previously flagged application.")
     async def unflag_application(self, ctx: discord.ApplicationContext, application_id: int):
         """Unflag a previously flagged application, allowing normal processing."""
-        # Fetch the application
-        app = self.db.get_application(application_id)
-        if not app:
-            embed = discord.Embed(title="Application Not Found", description=f"No application found with ID {application_id}.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
-            return
-
-        # Only allow unflagging flagged applications
-        status = app.get('status', '')
-        if status != 'flagged':
-            embed = discord.Embed(title="Not Flagged", description=f"Application ID {application_id} is not flagged and cannot be unflagged.", colour=discord.Color.orange())
-            await ctx.respond(embed=embed, ephemeral=True)
-            return
-
-        # Update DB status to submitted (or previous status)
-        updated = self.db.set_application_status(application_id, 'submitted')
+        # Update DB status to submitted, only if it is currently flagged
+        updated = await self._write(self.db.set_application_status, application_id, 'submitted', expected='flagged')
         if not updated:
-            embed = discord.Embed(title="Failed to Update", description="Failed to unflag the application. It may have been processed already.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+            # Only read the application back to explain why nothing changed
+            app = await self._db(self.db.get_application, application_id)
+            if not app:
+                await _err(ctx, "Application Not Found", f"No application found with ID {application_id}.")
+            elif app.get('status') != 'flagged':
+                embed = discord.Embed(title="Not Flagged", description=f"Application ID {application_id} is not flagged and cannot be unflagged.", colour=_ORANGE)
+                await ctx.respond(embed=embed, ephemeral=True)
+            else:
+                await _err(ctx, "Failed to Update", "Failed to unflag the application. It may have been processed already.")
             return
 
-        embed = discord.Embed(title="Application Unflagged", description=f"Application ID {application_id} has been unflagged and can be processed normally.", colour=discord.Color.green())
+        embed = discord.Embed(title="Application Unflagged", description=f"Application ID {application_id} has been unflagged and can be processed normally.", colour=_GREEN)
         await ctx.respond(embed=embed, ephemeral=True)
 
     # ----- New: user-level flagging commands -----
@@ -1104,138 +1340,149 @@ class Applications(commands.Cog):
     async def flag_user(self, ctx: discord.ApplicationContext, user: discord.User, *, reason: str = None):
         """Flag a user so staff will be pinged when they submit future applications."""
         try:
-            self.db.flag_user(user.id, ctx.author.id, reason, guild_id=ctx.guild.id if ctx.guild else None)
-            embed = discord.Embed(title="User Flagged", description=f"Flagged {user} (ID: {user.id}). Staff will be pinged if they re-apply.", colour=discord.Color.green())
+            await self._write(self.db.flag_user, user.id, ctx.author.id, reason, guild_id=ctx.guild.id if ctx.guild else None)
+            embed = discord.Embed(title="User Flagged", description=f"Flagged {user} (ID: {user.id}). Staff will be pinged if they re-apply.", colour=_GREEN)
             if reason:
-                truncated = (reason[:1900] + '...') if len(reason) > 1900 else reason
+                truncated = _truncate(reason)
                 embed.add_field(name="Reason", value=truncated, inline=False)
             await ctx.respond(embed=embed, ephemeral=True)
         except Exception:
-            embed = discord.Embed(title="Flag Failed", description="Failed to flag the user. Check logs.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+            logger.exception("Failed to flag user %s", user.id)
+            await _err(ctx, "Flag Failed", "Failed to flag the user. Check logs.")
 
     @perms_util.has_permission("manage_applications")
     @appsmanage_commands.command(name="unflag", description="Remove a user's application flag so staff won't be auto-pinged.")
     async def unflag_user(self, ctx: discord.ApplicationContext, user: discord.User):
         """Remove a user's application flag."""
         try:
-            removed = self.db.unflag_user(user.id)
+            removed = await self._write(self.db.unflag_user, user.id)
             if removed:
-                embed = discord.Embed(title="User Unflagged", description=f"Removed flag for {user} (ID: {user.id}).", colour=discord.Color.green())
+                embed = discord.Embed(title="User Unflagged", description=f"Removed flag for {user} (ID: {user.id}).", colour=_GREEN)
             else:
-                embed = discord.Embed(title="Not Flagged", description=f"{user} (ID: {user.id}) was not flagged.", colour=discord.Color.orange())
+                embed = discord.Embed(title="Not Flagged", description=f"{user} (ID: {user.id}) was not flagged.", colour=_ORANGE)
             await ctx.respond(embed=embed, ephemeral=True)
         except Exception:
-            embed = discord.Embed(title="Unflag Failed", description="Failed to remove the user's flag. Check logs.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+            logger.exception("Failed to unflag user %s", user.id)
+            await _err(ctx, "Unflag Failed", "Failed to remove the user's flag. Check logs.")
 
     @perms_util.has_permission("manage_applications")
     @appsmanage_commands.command(name="history", description="Displays all past applications (paged).")
-    async def history(self, ctx: discord.ApplicationContext, page: int = 1):
-        """Display ALL past applications including all statuses, paginated."""
-        try:
-            total = self.db.get_applications_count()
-        except Exception:
-            embed = discord.Embed(title="Database Error", description="Failed to fetch applications. Check logs.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+    async def history(self, ctx: discord.ApplicationContext, page: int = 1, before: int = None):
+        """Display ALL past applications including all statuses, paginated.
+        `before` continues from an application ID (shown in the footer), which stays fast however far back it goes.
+        """
+        per_page = _HISTORY_PER_PAGE
+        # Reject impossible input before acknowledging or touching the database
+        if before is None and page < 1:
+            await _err(ctx, "Page Not Found", f"Page {page} is out of range.")
             return
-
-        if total == 0:
-            embed = discord.Embed(title="No Applications", description="There are no applications on record.", colour=discord.Color.orange())
-            await ctx.respond(embed=embed, ephemeral=True)
+        if before is not None and before < 1:
+            await _err(ctx, "Page Not Found", f"There are no applications before ID {before}.")
             return
 
-        per_page = 4
-        total_pages = (total - 1) // per_page + 1
+        # Acknowledge first so the database work cannot run past the interaction deadline;
+        # ctx.respond sends followups from here on
+        await ctx.defer(ephemeral=True)
 
-        if page < 1 or page > total_pages:
-            embed = discord.Embed(
-                title="Page Not Found",
-                description=f"Page {page} is out of range. There {'is' if total_pages==1 else 'are'} {total_pages} page{'s' if total_pages!=1 else ''} available.",
-                colour=discord.Color.red()
-            )
-            await ctx.respond(embed=embed, ephemeral=True)
-            return
-
-        # Fetch page of applications
-        offset = (page - 1) * per_page
+        # Rows hold one application more than a page, to learn whether there is a next page without COUNT(*)
         try:
-            apps = self.db.get_applications(per_page, offset)
+            apps, positions = await self._history_page(page, before)
         except Exception:
-            embed = discord.Embed(title="Database Error", description="Failed to fetch applications. Check logs.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+            logger.exception("Failed to fetch applications history")
+            await ctx.respond(embed=_EMBED_HISTORY_DB_ERROR.copy(), ephemeral=True)
+            return
+        has_next = len(apps) > per_page
+        apps = apps[:per_page]
+
+        if not apps:
+            if before is None and page == 1:
+                await ctx.respond(embed=_EMBED_NO_APPLICATIONS.copy(), ephemeral=True)
+            elif before is None:
+                # Past the end: only now is the (cached) total worth counting
+                total_pages = (await self._applications_count() - 1) // per_page + 1
+                await _err(ctx, "Page Not Found", f"Page {page} is out of range. There {'is' if total_pages==1 else 'are'} {total_pages} page{'s' if total_pages!=1 else ''} available.")
+            else:
+                await _err(ctx, "Page Not Found", f"There are no applications before ID {before}.")
             return
 
-        embed = discord.Embed(title="Applications History", colour=discord.Color.blue())
-        # Each field shows a compact summary for an application
+        embed = discord.Embed(title="Applications History", colour=_BLUE)
+        # One description block per application; a single description fits more text than fields do
+        blocks = []
         for app in apps:
-            app_id = app.get('application_id')
-            uid = app.get('user_id')
             pos_id = app.get('position_id')
-            status = app.get('status', 'unknown')
-            submitted = app.get('submission_date')
+            position = positions.get(pos_id)
+            # Answers arrive already cut to _HISTORY_ANSWERS_CHARS
             answers = app.get('answers') or "(No content)"
-            # Truncate answers to avoid embed limits
-            if len(answers) > 800:
-                answers = answers[:800] + '...'
-
-            # Resolve position name if possible
-            position = self.db.get_position(pos_id)
-            position_name = position['name'] if position else f"ID {pos_id}"
-
-            name = f"App #{app_id} — {status.capitalize()}"
-            value = (f"Applicant: <@{uid}> (ID: {uid})\n"
-                     f"Position: {position_name} (ID: {pos_id})\n"
-                     f"Submitted: {submitted}\n\n"
-                     f"Answers:\n{answers}")
-            embed.add_field(name=name, value=value, inline=False)
-
-        embed.set_footer(text=f"Page {page}/{total_pages} — {total} application{'s' if total != 1 else ''}")
+            if (app.get('answers_len') or 0) > _HISTORY_ANSWERS_CHARS:
+                answers += '...'
+
+            blocks.append(_HISTORY_ROW_FMT.format(
+                aid=app.get('application_id'),
+                status=app.get('status', 'unknown').capitalize(),
+                uid=app.get('user_id'),
+                pname=position['name'] if position else f"ID {pos_id}",
+                pid=pos_id,
+                sub=app.get('submission_date'),
+                ans=answers,
+            ))
+        embed.description = _truncate("\n\n".join(blocks), _EMBED_DESCRIPTION_LIMIT - 3)
+
+        footer = f"Page {page}" if before is None else f"Before ID {before}"
+        if has_next:
+            footer += f" (more) — next: before:{apps[-1]['application_id']}"
+        embed.set_footer(text=footer)
         await ctx.respond(embed=embed, ephemeral=True)
 
+        # Warm the cache for the pages staff are likely to open next (no-ops when already cached)
+        if has_next:
+            next_key = ('before', apps[-1]['application_id']) if before is not None else self._history_key(page + 1, None)
+            self._spawn(self._history_rows(next_key))
+        if before is None and page > 1:
+            self._spawn(self._history_rows(self._history_key(page - 1, None)))
+
     @perms_util.has_permission("manage_applications")
     @appsmanage_commands.command(name="blacklist", description="Blacklist a user from submitting applications.")
     async def blacklist_user(self, ctx: discord.ApplicationContext, user: discord.User, *, reason: str = None):
         """Blacklist a user from submitting applications."""
+        await ctx.defer(ephemeral=True)
+        truncated = _truncate(reason) if reason else None
         try:
-            self.db.blacklist_user(user.id, ctx.author.id, reason)
-            embed = discord.Embed(title="User Blacklisted", description=f"Blacklisted {user} (ID: {user.id}). They cannot submit applications.", colour=discord.Color.green())
-            if reason:
-                truncated = (reason[:1900] + '...') if len(reason) > 1900 else reason
-                embed.add_field(name="Reason", value=truncated, inline=False)
-            await ctx.respond(embed=embed, ephemeral=True)
+            await self._db(self.db.blacklist_user, user.id, ctx.author.id, reason)
         except Exception:
-            embed = discord.Embed(title="Blacklist Failed", description="Failed to blacklist the user. Check logs.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+            logger.exception("Failed to blacklist user %s", user.id)
+            await ctx.respond(embed=_EMBED_BLACKLIST_FAILED.copy(), ephemeral=True)
+            return
 
+        # Notify the user in the background so the DM never delays the staff response
         dm_embed = discord.Embed(
             title="You Have Been Blacklisted",
             description="You have been blacklisted from submitting applications.",
-            colour=discord.Color.red()
+            colour=_RED
         )
-        if reason:
-            truncated = (reason[:1900] + '...') if len(reason) > 1900 else reason
+        if truncated:
             dm_embed.add_field(name="Reason", value=truncated, inline=False)
-        try:
-            await user.send(embed=dm_embed)
-        except Exception:
-            # Ignore DM failures
-            pass
+        self._spawn(self._safe_send(user, timeout=_DM_TIMEOUT, embed=dm_embed))
+
+        embed = discord.Embed(title="User Blacklisted", description=f"Blacklisted {user} (ID: {user.id}). They cannot submit applications.", colour=_GREEN)
+        if truncated:
+            embed.add_field(name="Reason", value=truncated, inline=False)
+        await ctx.respond(embed=embed, ephemeral=True)
 
     @perms_util.has_permission("manage_applications")
     @appsmanage_commands.command(name="unblacklist", description="Remove a user's blacklist status.")
     async def unblacklist_user(self, ctx: discord.ApplicationContext, user: discord.User):
         """Remove a user's blacklist status."""
+        await ctx.defer(ephemeral=True)
         try:
-            removed = self.db.unblacklist_user(user.id)
+            removed = await self._db(self.db.unblacklist_user, user.id)
             if removed:
-                embed = discord.Embed(title="User Unblacklisted", description=f"Removed blacklist for {user} (ID: {user.id}).", colour=discord.Color.green())
+                embed = discord.Embed(title="User Unblacklisted", description=f"Removed blacklist for {user} (ID: {user.id}).", colour=_GREEN)
             else:
-                embed = discord.Embed(title="Not Blacklisted", description=f"{user} (ID: {user.id}) was not blacklisted.", colour=discord.Color.orange())
+                embed = discord.Embed(title="Not Blacklisted", description=f"{user} (ID: {user.id}) was not blacklisted.", colour=_ORANGE)
             await ctx.respond(embed=embed, ephemeral=True)
         except Exception:
-            embed = discord.Embed(title="Unblacklist Failed", description="Failed to remove the user's blacklist. Check logs.", colour=discord.Color.red())
-            await ctx.respond(embed=embed, ephemeral=True)
+            logger.exception("Failed to unblacklist user %s", user.id)
+            await ctx.respond(embed=_EMBED_UNBLACKLIST_FAILED.copy(), ephemeral=True)
 
 
 # Setup function to add the cog to the bot
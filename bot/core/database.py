@@ -4,9 +4,18 @@
 import datetime
 import random
 import sqlite3
-from contextlib import closing
+import threading
+from contextlib import closing, contextmanager
 from typing import Optional, List, Dict
-import json
+try:
+    # Optional fast JSON backend for the in-progress answer state
+    import orjson as _json
+
+    def _json_dumps(obj) -> str:
+        return _json.dumps(obj).decode('utf-8')
+except ImportError:
+    import json as _json
+    _json_dumps = _json.dumps
 
 # Set up a database to be used for the economy system
 class EconomyDatabase:
@@ -317,11 +326,167 @@ class ModerationDatabase:
                 return warnings
 
 
+# Maximum number of idle read-only connections ApplicationsDatabase keeps open
+_READ_POOL_SIZE = 4
+# Prepared statements kept per ApplicationsDatabase connection (sqlite3's default is 128)
+_STATEMENT_CACHE_SIZE = 256
+# Most get_position results ApplicationsDatabase keeps cached
+_POSITION_CACHE_SIZE = 256
+
+# SQL for the queries run on every staff command. Kept as constants so each call passes the
+# same text and reuses the connection's prepared statement.
+_SQL_GET_APPLICATIONS_CHANNEL = 'SELECT channel_id FROM applications_channel WHERE guild_id = ?'
+_SQL_GET_POSITION_BY_ID = 'SELECT * FROM positions WHERE position_id = ?'
+_SQL_GET_POSITION_BY_NAME = 'SELECT * FROM positions WHERE name = ?'
+_SQL_GET_APPLICATION = 'SELECT application_id, user_id, position_id, answers, status, submission_date FROM applications WHERE application_id = ?'
+_SQL_GET_APPLICATIONS_PAGE = ('SELECT application_id, user_id, position_id, answers, status, submission_date '
+                              'FROM applications ORDER BY application_id DESC LIMIT ? OFFSET ?')
+_SQL_GET_APPLICATIONS_BEFORE = ('SELECT application_id, user_id, position_id, answers, status, submission_date '
+                                'FROM applications WHERE application_id < ? ORDER BY application_id DESC LIMIT ?')
+# History variants: SQLite cuts the answers, so long bodies are never copied out of the database
+_SQL_GET_APPLICATION_SUMMARIES_PAGE = ('SELECT application_id, user_id, position_id, substr(answers, 1, ?), status, submission_date, length(answers) '
+                                       'FROM applications ORDER BY application_id DESC LIMIT ? OFFSET ?')
+_SQL_GET_APPLICATION_SUMMARIES_BEFORE = ('SELECT application_id, user_id, position_id, substr(answers, 1, ?), status, submission_date, length(answers) '
+                                         'FROM applications WHERE application_id < ? ORDER BY application_id DESC LIMIT ?')
+_SQL_SET_APPLICATION_STATUS = 'UPDATE applications SET status = ? WHERE application_id = ? AND status != ?'
+_SQL_SET_APPLICATION_STATUS_FROM = 'UPDATE applications SET status = ? WHERE application_id = ? AND status != ? AND status = ?'
+
+
 class ApplicationsDatabase:
     def __init__(self, db_path='data/applications.db'):
         self.db_path = db_path
+        # One long-lived WAL connection for writes, guarded by a lock (see _connection)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+        self._write_depth = 0
+        # Pool of read-only connections; under WAL these run alongside each other and the writer (see _reader).
+        # The pool has its own lock so taking a reader never waits for a write transaction.
+        self._idle_readers: list[sqlite3.Connection] = []
+        self._busy_readers = 0
+        self._pool_lock = threading.Lock()
+        self._readers_idle = threading.Condition(self._pool_lock)
+        # LRU cache for get_position: (type, name/ID) -> position dict or None. Reads fill it from
+        # worker threads, so fills are checked against _position_gen (bumped on every clear) and a
+        # row read before a position write committed is never stored after that write's clear.
+        self._position_cache: dict[tuple, dict | None] = {}
+        self._position_gen = 0
+        self._position_lock = threading.Lock()
+        # Set by writes that change positions; the cache is cleared once their transaction ends
+        self._positions_dirty = False
         self._initialize_database()
 
+    @contextmanager
+    def _connection(self):
+        """Yield the shared connection, opening it on first use.
+        Commits when the block exits normally and rolls back if it raises.
+        """
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE)
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('PRAGMA synchronous=NORMAL')
+                self._conn = conn
+            if self._write_depth:
+                # Nested inside another block (see run_batch); the outermost block commits
+                yield self._conn
+                return
+            self._write_depth += 1
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.rollback()
+                raise
+            else:
+                self._conn.commit()
+            finally:
+                self._write_depth -= 1
+                if self._positions_dirty:
+                    # Clear only now that the change is visible to readers (see __init__)
+                    self._positions_dirty = False
+                    self.clear_position_cache()
+
+    def run_batch(self, calls: list) -> list:
+        """Run several write methods in a single transaction, so they share one commit.
+
+        Parameters:
+            calls: list of (method, args, kwargs) tuples, each a bound method of this database.
+        Returns:
+            A list with one (ok, result) pair per call, in order; `result` is the exception if the call raised.
+            Each call runs in its own savepoint, so a failing call does not undo the others.
+        """
+        results = []
+        with self._connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            for fn, args, kwargs in calls:
+                conn.execute('SAVEPOINT batch_call')
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception as e:
+                    conn.execute('ROLLBACK TO batch_call')
+                    results.append((False, e))
+                else:
+                    results.append((True, result))
+                conn.execute('RELEASE batch_call')
+        return results
+
+    @contextmanager
+    def _reader(self):
+        """Yield a read-only connection from the pool, opening one if none is idle.
+        Only the pool bookkeeping takes the pool lock (not the writer lock), so reads do not wait for writes.
+        """
+        with self._pool_lock:
+            if self._idle_readers:
+                conn = self._idle_readers.pop()
+            else:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE)
+                conn.execute('PRAGMA query_only=ON')
+            self._busy_readers += 1
+        try:
+            yield conn
+        finally:
+            with self._pool_lock:
+                self._busy_readers -= 1
+                if len(self._idle_readers) < _READ_POOL_SIZE:
+                    self._idle_readers.append(conn)
+                else:
+                    conn.close()
+                self._readers_idle.notify_all()
+
+    @contextmanager
+    def detached(self):
+        """Close all connections and keep them closed for the duration of the block, waiting for
+        in-flight reads to finish first. Use this around anything that replaces the database file;
+        connections reopen on next use.
+        """
+        # Writer lock first, then the pool lock (the order writes that read inside a transaction use)
+        with self._lock, self._pool_lock:
+            self._close_connections()
+            yield
+
+    def close(self) -> None:
+        """Close the writer and all pooled reader connections, waiting for in-flight reads first.
+        Call when the database is no longer used (e.g. on cog unload); connections reopen on next use.
+        """
+        with self._lock, self._pool_lock:
+            self._close_connections()
+
+    def _close_connections(self) -> None:
+        # Caller holds the writer lock and the pool lock
+        self._readers_idle.wait_for(lambda: self._busy_readers == 0)
+        for conn in self._idle_readers:
+            conn.close()
+        self._idle_readers.clear()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self.clear_position_cache()
+
+    def clear_position_cache(self) -> None:
+        """Drop cached get_position results (e.g. after the database file is replaced)."""
+        with self._position_lock:
+            self._position_gen += 1
+            self._position_cache.clear()
+
     def _now_iso(self) -> str:
         return datetime.datetime.now().isoformat()
 
@@ -377,7 +542,7 @@ class ApplicationsDatabase:
         """Initializes the database and creates the applications table if it doesn't exist.
         position structure: {'name': str, 'description': str, 'roles_given': list[int], 'questions': list[str], 'acceptance_message': str, 'rejection_message': str, 'open': bool}
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 # Create the positions table
                 cursor.execute('''
@@ -392,7 +557,6 @@ class ApplicationsDatabase:
                     open BOOLEAN DEFAULT 1
                 )
                 ''')
-                conn.commit()
 
                 # Create the applications channel table
                 cursor.execute('''
@@ -401,7 +565,6 @@ class ApplicationsDatabase:
                     channel_id INTEGER
                 )
                 ''')
-                conn.commit()
 
                 # Create the applications table
                 cursor.execute('''
@@ -415,7 +578,6 @@ class ApplicationsDatabase:
                     FOREIGN KEY (position_id) REFERENCES positions(position_id)
                 )
                 ''')
-                conn.commit()
 
                 # Create the application flags table (for auto-pinging staff when flagged users re-apply)
                 cursor.execute('''
@@ -427,7 +589,6 @@ class ApplicationsDatabase:
                     guild_id INTEGER
                 )
                 ''')
-                conn.commit()
 
                 # Create the blacklisted users table
                 cursor.execute('''
@@ -438,7 +599,30 @@ class ApplicationsDatabase:
                     blacklisted_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
                 ''')
-                conn.commit()
+
+                # Indexes for the hot lookups (primary keys are already rowid aliases):
+                # positions by name, a user's in-progress/submitted application, and all in-progress users
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_positions_name ON positions(name)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_user_status ON applications(user_id, status)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status)')
+        self.normalize_position_names()
+
+    def normalize_position_names(self) -> int:
+        """Rewrite stored position names into the strip().casefold() form that create and lookups use.
+        Older rows were stored with .lower(), which differs for some names (e.g. ones containing 'ß').
+        Run by _initialize_database (startup and after the file is replaced); a no-op once every name is normalized.
+        Returns:
+            int: The number of positions renamed.
+        """
+        with self._connection() as conn:
+            with closing(conn.cursor()) as cursor:
+                cursor.execute('SELECT position_id, name FROM positions')
+                renames = [(name.strip().casefold(), position_id) for position_id, name in cursor.fetchall()
+                           if name != name.strip().casefold()]
+                if renames:
+                    cursor.executemany('UPDATE positions SET name = ? WHERE position_id = ?', renames)
+                    self._positions_dirty = True
+                return len(renames)
 
     def set_applications_channel(self, guild_id: int, channel_id: int) -> None:
         """Sets the application submissions channel for a guild.
@@ -446,14 +630,13 @@ class ApplicationsDatabase:
             guild_id (int): The ID of the guild.
             channel_id (int): The ID of the channel to set for application submissions.
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute('''
                     INSERT INTO applications_channel (guild_id, channel_id)
                     VALUES (?, ?)
                     ON CONFLICT(guild_id) DO UPDATE SET channel_id=excluded.channel_id
                 ''', (guild_id, channel_id))
-                conn.commit()
 
     def get_applications_channel(self, guild_id: int) -> int | None:
         """Retrieves the application submissions channel for a guild.
@@ -462,9 +645,9 @@ class ApplicationsDatabase:
         Returns:
             int | None: The ID of the application submissions channel, or None if not set.
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._reader() as conn:
             with closing(conn.cursor()) as cursor:
-                cursor.execute('SELECT channel_id FROM applications_channel WHERE guild_id = ?', (guild_id,))
+                cursor.execute(_SQL_GET_APPLICATIONS_CHANNEL, (guild_id,))
                 row = cursor.fetchone()
                 return row[0] if row else None
 
@@ -475,13 +658,13 @@ class ApplicationsDatabase:
         Returns:
             int: The ID of the newly created position.
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute('''
                     INSERT INTO positions (name, description, roles_given, questions, acceptance_message, rejection_message, open)
                     VALUES (?, '', '', '', '', '', 1)
                 ''', (name,))
-                conn.commit()
+                self._positions_dirty = True
                 return cursor.lastrowid
 
     def remove_position(self, position_id: int) -> None:
@@ -489,51 +672,92 @@ class ApplicationsDatabase:
         Parameters:
             position_id (int): The ID of the position to be removed.
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute('DELETE FROM positions WHERE position_id = ?', (position_id,))
-                conn.commit()
+                self._positions_dirty = True
 
     def get_positions(self) -> List[Dict]:
         """Retrieves all positions from the database.
         Returns:
             list: A list of positions, each represented as a dictionary.
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._reader() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute('SELECT * FROM positions')
                 rows = cursor.fetchall()
                 return [self._position_from_row(row) for row in rows]
 
     def get_position(self, name: str) -> dict | None:
-        """Retrieves a specific position by its ID or name.
+        """Retrieves a specific position by its ID or name. Results are cached until a position changes;
+        each call returns its own copy.
         Parameters:
             name (str|int): The name of the position or the numeric position_id.
         Returns:
             dict | None: The position represented as a dictionary, or None if not found.
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        key = (type(name), name)
+        with self._position_lock:
+            if key in self._position_cache:
+                # Re-insert so the dict's order doubles as recency order
+                position = self._position_cache[key] = self._position_cache.pop(key)
+                return self._copy_position(position)
+            gen = self._position_gen
+        position = self._get_position_uncached(name)
+        with self._position_lock:
+            # Skip the fill if the cache was cleared while this read ran; the row may predate that change
+            if gen == self._position_gen:
+                if len(self._position_cache) >= _POSITION_CACHE_SIZE:
+                    self._position_cache.pop(next(iter(self._position_cache)))
+                self._position_cache[key] = position
+        return self._copy_position(position)
+
+    @staticmethod
+    def _copy_position(position: dict | None) -> dict | None:
+        """Return a copy of a cached position that callers can modify freely."""
+        if position is None:
+            return None
+        return {**position, 'roles_given': list(position['roles_given']), 'questions': list(position['questions'])}
+
+    def _get_position_uncached(self, name) -> dict | None:
+        with self._reader() as conn:
             with closing(conn.cursor()) as cursor:
                 # Accept either an integer position_id or a name string
                 if isinstance(name, int):
-                    cursor.execute('SELECT * FROM positions WHERE position_id = ?', (name,))
+                    cursor.execute(_SQL_GET_POSITION_BY_ID, (name,))
                 else:
-                    cursor.execute('SELECT * FROM positions WHERE name = ?', (name,))
+                    cursor.execute(_SQL_GET_POSITION_BY_NAME, (name,))
                 row = cursor.fetchone()
                 if row:
                     return self._position_from_row(row)
                 return None
 
+    def get_positions_bulk(self, position_ids) -> Dict[int, Dict]:
+        """Fetch several positions by ID in one query.
+        Parameters:
+            position_ids: iterable of position IDs (duplicates are fine).
+        Returns:
+            Dict[int, Dict]: position_id -> position dict; IDs with no position are left out.
+        """
+        ids = list(set(position_ids))
+        if not ids:
+            return {}
+        with self._reader() as conn:
+            with closing(conn.cursor()) as cursor:
+                placeholders = ', '.join('?' * len(ids))
+                cursor.execute(f'SELECT * FROM positions WHERE position_id IN ({placeholders})', ids)
+                return {row[0]: self._position_from_row(row) for row in cursor.fetchall()}
+
     def set_position_open(self, position_id: int, open: bool) -> None:
         """Sets whether a position is open for applications.
         Parameters:
             position_id (int): The ID of the position to be updated.
             open (bool): Whether the position is open.
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute('UPDATE positions SET open = ? WHERE position_id = ?', (int(open), position_id))
-                conn.commit()
+                self._positions_dirty = True
 
     def modify(self, position_id: int, attribute: str, value) -> None:
         """Modifies an attribute of a position.
@@ -542,7 +766,7 @@ class ApplicationsDatabase:
             attribute (str): The attribute to be modified (description, roles_given, questions, acceptance_message, rejection_message).
             value: The new value for the attribute.
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 if attribute == 'name':
                     cursor.execute('UPDATE positions SET name = ? WHERE position_id = ?', (value, position_id))
@@ -558,13 +782,13 @@ class ApplicationsDatabase:
                     cursor.execute('UPDATE positions SET acceptance_message = ? WHERE position_id = ?', (value, position_id))
                 elif attribute == 'rejection_message':
                     cursor.execute('UPDATE positions SET rejection_message = ? WHERE position_id = ?', (value, position_id))
-                conn.commit()
+                self._positions_dirty = True
 
     # --- New methods for DM-based application flow ---
     def start_application(self, user_id: int, position_id: int) -> int:
         """Create or reset an in-progress application for a user. Returns the application_id."""
         now_iso = self._now_iso()
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 # Remove any existing in-progress application for this user
                 cursor.execute("DELETE FROM applications WHERE user_id = ? AND status = 'in_progress'", (user_id,))
@@ -572,12 +796,11 @@ class ApplicationsDatabase:
                     INSERT INTO applications (user_id, position_id, answers, status, submission_date)
                     VALUES (?, ?, ?, 'in_progress', ?)
                 ''', (user_id, position_id, '', now_iso))
-                conn.commit()
                 return cursor.lastrowid
 
     def get_in_progress_application(self, user_id: int) -> dict | None:
         """Return the in-progress application row for a user, or None."""
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._reader() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute("SELECT application_id, position_id, answers, status, submission_date FROM applications WHERE user_id = ? AND status = 'in_progress' ORDER BY application_id DESC LIMIT 1", (user_id,))
                 row = cursor.fetchone()
@@ -591,6 +814,13 @@ class ApplicationsDatabase:
                     'submission_date': row[4]
                 }
 
+    def get_in_progress_user_ids(self) -> set[int]:
+        """Return the IDs of all users with an in-progress application."""
+        with self._reader() as conn:
+            with closing(conn.cursor()) as cursor:
+                cursor.execute("SELECT DISTINCT user_id FROM applications WHERE status = 'in_progress'")
+                return {row[0] for row in cursor.fetchall()}
+
     def submit_application(self, user_id: int, answers: str) -> tuple:
         """Submit the user's in-progress application.
         Returns (True, application_id, position_id) on success, or (False, reason) on failure.
@@ -598,7 +828,7 @@ class ApplicationsDatabase:
         """
         now = datetime.datetime.now()
         now_iso = now.isoformat()
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute("SELECT application_id, position_id, submission_date FROM applications WHERE user_id = ? AND status = 'in_progress' ORDER BY application_id DESC LIMIT 1", (user_id,))
                 row = cursor.fetchone()
@@ -610,18 +840,16 @@ class ApplicationsDatabase:
                 if now - started > datetime.timedelta(hours=24):
                     # expired - remove the in-progress application
                     cursor.execute('DELETE FROM applications WHERE application_id = ?', (application_id,))
-                    conn.commit()
                     return (False, 'expired')
                 # update with answers and mark submitted
                 cursor.execute("UPDATE applications SET answers = ?, status = 'submitted', submission_date = ? WHERE application_id = ?", (answers, now_iso, application_id))
-                conn.commit()
                 return (True, application_id, position_id)
 
     def get_application(self, application_id: int) -> dict | None:
         """Retrieve a single application row by its ID."""
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._reader() as conn:
             with closing(conn.cursor()) as cursor:
-                cursor.execute('SELECT application_id, user_id, position_id, answers, status, submission_date FROM applications WHERE application_id = ?', (application_id,))
+                cursor.execute(_SQL_GET_APPLICATION, (application_id,))
                 row = cursor.fetchone()
                 if not row:
                     return None
@@ -634,9 +862,42 @@ class ApplicationsDatabase:
                     'submission_date': row[5]
                 }
 
+    def get_approval_bundle(self, application_id: int, guild_id: int | None) -> dict | None:
+        """Fetch an application together with its position and the guild's applications channel in one query.
+        Parameters:
+            application_id (int): The ID of the application.
+            guild_id (int | None): The guild whose applications channel should be included.
+        Returns:
+            dict | None: The fields of get_application plus 'position' (dict, or None if the position
+            no longer exists) and 'channel_id' (int | None); None if the application does not exist.
+        """
+        with self._reader() as conn:
+            with closing(conn.cursor()) as cursor:
+                cursor.execute(
+                    'SELECT a.application_id, a.user_id, a.position_id, a.answers, a.status, a.submission_date, '
+                    'p.position_id, p.name, p.description, p.roles_given, p.questions, p.acceptance_message, p.rejection_message, p.open, '
+                    '(SELECT channel_id FROM applications_channel WHERE guild_id = ?) '
+                    'FROM applications a LEFT JOIN positions p ON p.position_id = a.position_id '
+                    'WHERE a.application_id = ?',
+                    (guild_id, application_id)
+                )
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                return {
+                    'application_id': row[0],
+                    'user_id': row[1],
+                    'position_id': row[2],
+                    'answers': row[3],
+                    'status': row[4],
+                    'submission_date': row[5],
+                    'position': self._position_from_row(row[6:14]) if row[6] is not None else None,
+                    'channel_id': row[14]
+                }
+
     def get_latest_submitted_application(self, user_id: int) -> dict | None:
         """Return the most recent submitted application for a user (status = 'submitted')."""
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._reader() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute("SELECT application_id, user_id, position_id, answers, status, submission_date FROM applications WHERE user_id = ? AND status = 'submitted' ORDER BY application_id DESC LIMIT 1", (user_id,))
                 row = cursor.fetchone()
@@ -653,38 +914,56 @@ class ApplicationsDatabase:
 
     def get_applications_count(self) -> int:
         """Return the total number of application rows in the database."""
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._reader() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute('SELECT COUNT(*) FROM applications')
                 row = cursor.fetchone()
                 return int(row[0]) if row else 0
 
-    def get_applications(self, limit: int, offset: int) -> list:
+    def get_applications(self, limit: int, offset: int, answers_chars: int | None = None) -> list:
         """Fetch a page of applications ordered by newest first.
 
-        Returns a list of dicts with the same shape as `get_application`.
+        Returns a list of dicts with the same shape as `get_application`. If `answers_chars` is given,
+        'answers' is cut to that many characters by SQLite and 'answers_len' holds the full length.
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._reader() as conn:
             with closing(conn.cursor()) as cursor:
-                cursor.execute(
-                    'SELECT application_id, user_id, position_id, answers, status, submission_date '
-                    'FROM applications '
-                    'ORDER BY application_id DESC '
-                    'LIMIT ? OFFSET ?',
-                    (limit, offset)
-                )
-                rows = cursor.fetchall()
-                apps = []
-                for row in rows:
-                    apps.append({
-                        'application_id': row[0],
-                        'user_id': row[1],
-                        'position_id': row[2],
-                        'answers': row[3],
-                        'status': row[4],
-                        'submission_date': row[5]
-                    })
-                return apps
+                if answers_chars is None:
+                    cursor.execute(_SQL_GET_APPLICATIONS_PAGE, (limit, offset))
+                else:
+                    cursor.execute(_SQL_GET_APPLICATION_SUMMARIES_PAGE, (answers_chars, limit, offset))
+                return [self._application_from_row(row) for row in cursor.fetchall()]
+
+    def get_applications_before(self, before_id: int | None, limit: int, answers_chars: int | None = None) -> list:
+        """Fetch up to `limit` applications older than `before_id` (all if None), newest first.
+        Keyset pagination: the page is an index range scan on application_id however deep it is.
+
+        Returns a list of dicts like `get_applications`, including the `answers_chars` behaviour.
+        """
+        if before_id is None:
+            # Every rowid is below this, so the first page uses the same statement
+            before_id = 2 ** 63 - 1
+        with self._reader() as conn:
+            with closing(conn.cursor()) as cursor:
+                if answers_chars is None:
+                    cursor.execute(_SQL_GET_APPLICATIONS_BEFORE, (before_id, limit))
+                else:
+                    cursor.execute(_SQL_GET_APPLICATION_SUMMARIES_BEFORE, (answers_chars, before_id, limit))
+                return [self._application_from_row(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _application_from_row(row) -> Dict:
+        app = {
+            'application_id': row[0],
+            'user_id': row[1],
+            'position_id': row[2],
+            'answers': row[3],
+            'status': row[4],
+            'submission_date': row[5]
+        }
+        if len(row) > 6:
+            app['answers_len'] = row[6]
+        return app
 
     def add_answer_to_in_progress(self, user_id: int, answer_text: str):
         """Append an answer to the user's in-progress application.
@@ -694,11 +973,11 @@ class ApplicationsDatabase:
         'submitted' and replaces the stored JSON with a human-readable combined
         answers string. Returns a tuple describing the result:
 
-        (True, completed: bool, application_id: int, position_id: int, next_question: str|None, final_answers: str|None)
+        (True, completed: bool, application_id: int, position_id: int, next_question: str|None, final_answers: str|None, answered_count: int)
 
         On failure returns (False, reason_string).
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute("SELECT application_id, position_id, answers, status, submission_date FROM applications WHERE user_id = ? AND status = 'in_progress' ORDER BY application_id DESC LIMIT 1", (user_id,))
                 row = cursor.fetchone()
@@ -711,7 +990,6 @@ class ApplicationsDatabase:
                 if datetime.datetime.now() - started > datetime.timedelta(hours=24):
                     # expired - remove the in-progress application
                     cursor.execute('DELETE FROM applications WHERE application_id = ?', (application_id,))
-                    conn.commit()
                     return (False, 'expired')
 
                 # Fetch the position questions
@@ -726,7 +1004,7 @@ class ApplicationsDatabase:
                 state = {'answers': []}
                 if answers_raw:
                     try:
-                        parsed = json.loads(answers_raw)
+                        parsed = _json.loads(answers_raw)
                         if isinstance(parsed, dict) and 'answers' in parsed and isinstance(parsed['answers'], list):
                             state = parsed
                     except Exception:
@@ -748,8 +1026,7 @@ class ApplicationsDatabase:
                     combined = "\n\n".join(combined_parts)
                     now_iso = self._now_iso()
                     cursor.execute("UPDATE applications SET answers = ?, status = 'submitted', submission_date = ? WHERE application_id = ?", (combined, now_iso, application_id))
-                    conn.commit()
-                    return (True, True, application_id, position_id, None, combined)
+                    return (True, True, application_id, position_id, None, combined, len(state['answers']))
 
                 # Otherwise store interim JSON state and return the next question text
                 try:
@@ -758,9 +1035,8 @@ class ApplicationsDatabase:
                 except Exception:
                     next_question = None
 
-                cursor.execute("UPDATE applications SET answers = ? WHERE application_id = ?", (json.dumps(state), application_id))
-                conn.commit()
-                return (True, False, application_id, position_id, next_question, None)
+                cursor.execute("UPDATE applications SET answers = ? WHERE application_id = ?", (_json_dumps(state), application_id))
+                return (True, False, application_id, position_id, next_question, None, len(state['answers']))
 
     def is_user_blacklisted(self, user_id: int) -> bool:
         """Check if a user is blacklisted from applying.
@@ -769,7 +1045,7 @@ class ApplicationsDatabase:
         Returns:
             bool: True if the user is blacklisted, False otherwise.
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._reader() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute('SELECT 1 FROM application_blacklist WHERE user_id = ?', (user_id,))
                 row = cursor.fetchone()
@@ -778,7 +1054,7 @@ class ApplicationsDatabase:
     # -- New helper methods expected by the applications cog --
     def is_user_flagged(self, user_id: int, guild_id: int | None = None) -> bool:
         """Return True if the user is flagged (optionally scoped to a guild)."""
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._reader() as conn:
             with closing(conn.cursor()) as cursor:
                 if guild_id is None:
                     cursor.execute('SELECT 1 FROM application_flags WHERE user_id = ?', (user_id,))
@@ -789,46 +1065,42 @@ class ApplicationsDatabase:
     def flag_user(self, user_id: int, flagged_by: int | None = None, reason: str | None = None, guild_id: int | None = None) -> None:
         """Flag a user to auto-ping staff when they re-apply. Overwrites existing flag for the user."""
         now = datetime.datetime.now().isoformat()
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute('''
                     INSERT INTO application_flags (user_id, flagged_by, reason, flagged_at, guild_id)
                     VALUES (?, ?, ?, ?, ?)
                     ON CONFLICT(user_id) DO UPDATE SET flagged_by = excluded.flagged_by, reason = excluded.reason, flagged_at = excluded.flagged_at, guild_id = excluded.guild_id
                 ''', (user_id, flagged_by, reason, now, guild_id))
-                conn.commit()
 
     def unflag_user(self, user_id: int) -> bool:
         """Remove a user's application flag. Returns True if a row was removed."""
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute('DELETE FROM application_flags WHERE user_id = ?', (user_id,))
-                conn.commit()
                 return cursor.rowcount > 0
 
     def blacklist_user(self, user_id: int, blacklisted_by: int | None = None, reason: str | None = None) -> None:
         """Blacklist a user from submitting applications. Overwrites any existing blacklist entry."""
         now = datetime.datetime.now().isoformat()
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute('''
                     INSERT INTO application_blacklist (user_id, blacklisted_by, reason, blacklisted_at)
                     VALUES (?, ?, ?, ?)
                     ON CONFLICT(user_id) DO UPDATE SET blacklisted_by = excluded.blacklisted_by, reason = excluded.reason, blacklisted_at = excluded.blacklisted_at
                 ''', (user_id, blacklisted_by, reason, now))
-                conn.commit()
 
     def unblacklist_user(self, user_id: int) -> bool:
         """Remove a user's blacklist status. Returns True if a row was removed."""
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 cursor.execute('DELETE FROM application_blacklist WHERE user_id = ?', (user_id,))
-                conn.commit()
                 return cursor.rowcount > 0
 
     def withdraw_application(self, application_id: int) -> bool:
         """Mark an application as withdrawn. Returns True if updated."""
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
                 # Only change if the application exists and is not already final
                 cursor.execute('SELECT status FROM applications WHERE application_id = ?', (application_id,))
@@ -839,27 +1111,42 @@ class ApplicationsDatabase:
                 if current in ('withdrawn', 'accepted', 'rejected'):
                     return False
                 cursor.execute("UPDATE applications SET status = 'withdrawn' WHERE application_id = ?", (application_id,))
-                conn.commit()
                 return cursor.rowcount > 0
 
-    def set_application_status(self, application_id: int, status: str) -> bool:
-        """Set an application's status. Returns True if the row was updated."""
+    def set_application_status(self, application_id: int, status: str, expected: str | None = None) -> bool:
+        """Set an application's status. Returns True if the row was updated.
+        Returns False if the application does not exist, already has `status`, or (when `expected`
+        is given) does not currently have status `expected`. The check and the write are one statement.
+        """
         # Basic validation of status
         allowed = {'pending', 'under_review', 'accepted', 'rejected', 'withdrawn', 'flagged', 'on_hold', 'submitted'}
         if status not in allowed:
             return False
-        with closing(sqlite3.connect(self.db_path)) as conn:
+        with self._connection() as conn:
             with closing(conn.cursor()) as cursor:
-                cursor.execute('SELECT status FROM applications WHERE application_id = ?', (application_id,))
-                row = cursor.fetchone()
-                if not row:
-                    return False
-                if row[0] == status:
-                    return False
-                cursor.execute('UPDATE applications SET status = ? WHERE application_id = ?', (status, application_id))
-                conn.commit()
+                if expected is None:
+                    cursor.execute(_SQL_SET_APPLICATION_STATUS, (status, application_id, status))
+                else:
+                    cursor.execute(_SQL_SET_APPLICATION_STATUS_FROM, (status, application_id, status, expected))
                 return cursor.rowcount > 0
 
+    def decide_application(self, application_id: int, status: str) -> bool:
+        """Give an application a final status ('accepted' or 'rejected') unless it already has one.
+        The check and the update are a single statement, so two staff members cannot both decide it.
+        Returns True if the row was updated.
+        """
+        if status not in ('accepted', 'rejected'):
+            return False
+        with self._connection() as conn:
+            with closing(conn.cursor()) as cursor:
+                cursor.execute(
+                    "UPDATE applications SET status = ? "
+                    "WHERE application_id = ? AND status NOT IN ('accepted', 'rejected', 'withdrawn') "
+                    "RETURNING status",
+                    (status, application_id)
+                )
+                return cursor.fetchone() is not None
+
     def is_valid_database(self, path: str) -> tuple[bool, str | None]:
         """Quickly validate that a given sqlite file contains the expected tables and columns for the applications DB.
         Returns (True, None) on success or (False, reason) on failure."""
@@ -892,3 +1179,14 @@ class ApplicationsDatabase:
             return (False, f"Not a valid sqlite database: {e}")
         except Exception as e:
             return (False, str(e))
+
+    def backup_to(self, path: str) -> None:
+        """Write a consistent copy of the database to `path` with SQLite's online backup.
+        Under WAL the main file alone can miss recent commits (they sit in the -wal file until a
+        checkpoint), so copies handed out must be made this way rather than from db_path.
+        Parameters:
+            path (str): Destination file; overwritten if it exists.
+        """
+        with self._reader() as conn:
+            with closing(sqlite3.connect(path)) as dest:
+                conn.backup(dest)
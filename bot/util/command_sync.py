@@ -0,0 +1,163 @@
+#######################################################
+# Slash command sync helpers
+#######################################################
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Dict, List, Optional
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+# Environment variable selecting how !sync pushes commands to Discord:
+#   safe - diff against the registered commands and only write what changed (default)
+#   bulk - py-cord's bot.sync_commands() (bulk overwrite)
+#   off  - never sync
+SYNC_POLICY_ENV = "DISCORD_COMMAND_SYNC_POLICY"
+SYNC_POLICIES = ("safe", "bulk", "off")
+
+# Time budget for creating/updating the commands of loaded cogs (the critical path)
+CRITICAL_SYNC_TIMEOUT = 30
+# Separate, wider budget for deleting commands that no longer exist locally
+ORPHAN_SWEEP_BUDGET = 300
+
+# Keep references to detached sweep tasks so they are not garbage collected mid-run
+_background_tasks: set = set()
+
+# Option keys whose falsy value Discord omits from its responses
+_FALSY_OPTION_KEYS = ("required", "autocomplete")
+
+
+def get_sync_policy() -> str:
+    """Return the configured sync policy, falling back to 'safe' for unknown values."""
+    policy = (os.getenv(SYNC_POLICY_ENV) or "safe").strip().lower()
+    if policy not in SYNC_POLICIES:
+        logger.warning("Unknown %s=%r; using 'safe'.", SYNC_POLICY_ENV, policy)
+        return "safe"
+    return policy
+
+
+def _normalize_options(options: Optional[List[Dict]]) -> List[Dict]:
+    """Normalize a list of command options so local and remote payloads compare equal."""
+    normalized = []
+    for option in options or []:
+        opt = {k: v for k, v in option.items() if v is not None and v != [] and v != {}}
+        for key in _FALSY_OPTION_KEYS:
+            if not opt.get(key):
+                opt.pop(key, None)
+        if "options" in opt:
+            opt["options"] = _normalize_options(opt["options"])
+        if "channel_types" in opt:
+            opt["channel_types"] = sorted(opt["channel_types"])
+        normalized.append(opt)
+    return normalized
+
+
+def _canonical_payload(payload: Dict, desired: Dict) -> Dict:
+    """Return the fields of `payload` that matter for a sync decision, in a comparable form.
+
+    `desired` is the local payload; fields it does not manage (contexts, integration_types)
+    are dropped so values filled in by Discord do not register as drift.
+    """
+    dmp = payload.get("default_member_permissions")
+    canonical = {
+        "name": payload.get("name"),
+        "type": payload.get("type", 1),
+        "description": payload.get("description") or "",
+        "options": _normalize_options(payload.get("options")),
+        "nsfw": bool(payload.get("nsfw", False)),
+        "dm_permission": bool(payload.get("dm_permission", True)),
+        "default_member_permissions": str(dmp) if dmp is not None else None,
+        "name_localizations": payload.get("name_localizations") or None,
+        "description_localizations": payload.get("description_localizations") or None,
+    }
+    for key in ("contexts", "integration_types"):
+        if desired.get(key) is not None:
+            canonical[key] = sorted(payload.get(key) or [])
+    return canonical
+
+
+def _register(bot, cmd, data: Dict) -> None:
+    """Record the Discord-assigned ID on the command so interactions dispatch by ID."""
+    cmd.id = data["id"]
+    bot._application_commands[cmd.id] = cmd
+
+
+def _retry_after(exc: discord.HTTPException) -> Optional[float]:
+    """Return how long to wait before retrying a rate-limited request, or None if it should not be retried."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    if exc.status != 429 and headers.get("X-RateLimit-Remaining") != "0":
+        return None
+    try:
+        return float(headers.get("X-RateLimit-Reset-After") or headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+async def _reconcile_active(bot, app_id: int, remote: Dict, stats: Dict[str, int]) -> None:
+    """Create or patch the commands registered by loaded cogs. Matched entries are popped from `remote`."""
+    for cmd in bot.pending_application_commands:
+        if cmd.guild_ids:
+            # Guild-scoped commands are not managed by the safe reconciler
+            continue
+        desired = cmd.to_dict()
+        current = remote.pop((desired["name"], desired.get("type", 1)), None)
+        if current is None:
+            data = await bot.http.upsert_global_command(app_id, desired)
+            stats["created"] += 1
+        elif _canonical_payload(current, desired) != _canonical_payload(desired, desired):
+            data = await bot.http.edit_global_command(app_id, current["id"], desired)
+            stats["updated"] += 1
+        else:
+            data = current
+            stats["unchanged"] += 1
+        _register(bot, cmd, data)
+
+
+async def _sweep_orphans(bot, app_id: int, stale: List[Dict], budget: float) -> None:
+    """Delete stale commands one at a time, backing off on rate limits, until done or out of budget."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + budget
+    for index, command in enumerate(stale):
+        while True:
+            try:
+                await bot.http.delete_global_command(app_id, command["id"])
+                logger.info("Deleted stale slash command '%s'.", command["name"])
+                break
+            except discord.NotFound:
+                break
+            except discord.HTTPException as e:
+                wait = _retry_after(e)
+                if wait is None or loop.time() + wait > deadline:
+                    logger.warning("Failed to delete stale slash command '%s': %s", command["name"], e)
+                    break
+                await asyncio.sleep(wait)
+        if loop.time() >= deadline and index + 1 < len(stale):
+            logger.warning("Orphan sweep ran out of time; %d stale slash command(s) left.", len(stale) - index - 1)
+            return
+
+
+async def safe_sync(bot) -> Dict[str, int]:
+    """Reconcile global slash commands with Discord, writing only the commands that drifted.
+
+    New commands are created and changed commands are patched within CRITICAL_SYNC_TIMEOUT.
+    Registered commands that no longer exist locally are deleted by a detached task with its
+    own budget, so a slow cleanup never holds up the caller. Returns counts per action.
+    """
+    app_id = bot.user.id
+    existing = await bot.http.get_global_commands(app_id)
+    remote = {(c["name"], c.get("type", 1)): c for c in existing}
+    stats = {"created": 0, "updated": 0, "unchanged": 0, "stale": 0}
+
+    await asyncio.wait_for(_reconcile_active(bot, app_id, remote, stats), timeout=CRITICAL_SYNC_TIMEOUT)
+
+    stale = list(remote.values())
+    if stale:
+        stats["stale"] = len(stale)
+        task = asyncio.create_task(_sweep_orphans(bot, app_id, stale, budget=ORPHAN_SWEEP_BUDGET))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+    return stats
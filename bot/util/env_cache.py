@@ -0,0 +1,65 @@
+#######################################################
+# Cached .env loading
+#######################################################
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List
+
+from dotenv import dotenv_values, load_dotenv
+
+logger = logging.getLogger(__name__)
+
+# env_cache.py is located at bot/util/env_cache.py, so go up two parents to project root
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_ENV_FILENAME = _PROJECT_ROOT / ".env"
+_CACHE_FILENAME = _PROJECT_ROOT / ".env.cache"
+
+
+def _read_cache(env_key: List[int]) -> Dict[str, str] | None:
+    """Return the cached values if they were parsed from a .env with the same key, otherwise None."""
+    try:
+        with _CACHE_FILENAME.open("r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("key") != env_key:
+        return None
+    values = data.get("values")
+    return values if isinstance(values, dict) else None
+
+
+def _write_cache(env_key: List[int], values: Dict[str, str]) -> None:
+    try:
+        # The cache holds the same secrets as .env, so keep it owner-only
+        fd = os.open(_CACHE_FILENAME, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump({"key": env_key, "values": values}, fh)
+    except OSError as e:
+        logger.warning("Failed to write env cache %s: %s", _CACHE_FILENAME, e)
+
+
+def load_env() -> None:
+    """Load the project's .env into os.environ, reusing the parsed values while .env is unchanged.
+
+    Like load_dotenv(), variables already set in the environment are not overridden.
+    """
+    try:
+        stat = _ENV_FILENAME.stat()
+    except OSError:
+        # No .env at the project root; keep dotenv's own lookup
+        load_dotenv()
+        return
+
+    # Keyed on .env's exact mtime and size (stored in the cache file), so any replaced .env,
+    # including one restored with an older mtime, is parsed again
+    env_key = [stat.st_mtime_ns, stat.st_size]
+    values = _read_cache(env_key)
+    if values is None:
+        values = {k: v for k, v in dotenv_values(_ENV_FILENAME).items() if v is not None}
+        _write_cache(env_key, values)
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
@@ -0,0 +1,56 @@
+#######################################################
+# Short-lived cache for permission check results
+#######################################################
+from __future__ import annotations
+
+import time
+from typing import Dict, Optional, Tuple
+
+# How long (seconds) a cached permission decision stays valid
+DEFAULT_TTL = 60.0
+
+_Key = Tuple[int, int, str]
+
+
+class PermissionCache:
+    """Cache of permission decisions keyed by (guild_id, user_id, permission).
+
+    Entries expire after `ttl` seconds. Callers should invalidate a member when their roles
+    change and clear everything when the role -> permission mapping is edited.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+        self._store: Dict[_Key, Tuple[bool, float]] = {}
+
+    def get(self, guild_id: int, user_id: int, permission: str) -> Optional[bool]:
+        """Return the cached decision, or None if absent or expired."""
+        key = (guild_id, user_id, permission)
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        allowed, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._store.pop(key, None)
+            return None
+        return allowed
+
+    def set(self, guild_id: int, user_id: int, permission: str, allowed: bool) -> None:
+        self._store[(guild_id, user_id, permission)] = (allowed, time.monotonic() + self.ttl)
+
+    def invalidate_member(self, guild_id: int, user_id: int) -> None:
+        """Drop every cached decision for one member of a guild."""
+        for key in [k for k in self._store if k[0] == guild_id and k[1] == user_id]:
+            del self._store[key]
+
+    def invalidate_guild(self, guild_id: int) -> None:
+        """Drop every cached decision for a guild."""
+        for key in [k for k in self._store if k[0] == guild_id]:
+            del self._store[key]
+
+    def clear(self) -> None:
+        self._store.clear()
+
+
+# Shared instance used by the permission checks in bot.util.perms
+permission_cache = PermissionCache()
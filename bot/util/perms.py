@@ -11,6 +11,12 @@ from typing import Dict, List, Union, Optional
 
 from discord.ext import commands
 
+try:
+    from bot.util.perm_cache import permission_cache
+except ImportError:
+    # Fallback when bot/ itself is on sys.path
+    from util.perm_cache import permission_cache
+
 # Path to the role permissions file (relative to project root)
 # perms.py is located at bot/util/perms.py, so go up two parents to project root
 _ROLEPERMS_FILENAME = Path(__file__).resolve().parents[2] / "data" / "roleperms.json"
@@ -18,6 +24,9 @@ _ROLEPERMS_FILENAME = Path(__file__).resolve().parents[2] / "data" / "roleperms.
 # Top-level key used in the JSON file
 _TOP_KEY = "role_perms"
 
+# Parsed mapping from the last load, keyed by the file's (mtime_ns, size); see load_role_perms
+_loaded: Optional[tuple] = None
+
 
 def _ensure_file_exists() -> None:
     """Ensure the roleperms.json file exists; if not, create a minimal structure.
@@ -35,7 +44,14 @@ def load_role_perms() -> Dict[str, List[str]]:
     Returns a dict mapping permission name -> list of role ID strings.
     Nulls and missing values are normalized to empty lists.
     """
+    global _loaded
     _ensure_file_exists()
+    # Reuse the parsed mapping while the file is unchanged; hand out copies as callers edit them
+    stat = _ROLEPERMS_FILENAME.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if _loaded is not None and _loaded[0] == signature:
+        return {perm: list(roles) for perm, roles in _loaded[1].items()}
+
     try:
         with _ROLEPERMS_FILENAME.open("r", encoding="utf-8") as fh:
             data = json.load(fh)
@@ -57,7 +73,8 @@ def load_role_perms() -> Dict[str, List[str]]:
             # If value is a single scalar (unexpected), coerce to single-item list
             normalized[perm] = [str(value)]
 
-    return normalized
+    _loaded = (signature, normalized)
+    return {perm: list(roles) for perm, roles in normalized.items()}
 
 
 def save_role_perms(perms: Dict[str, List[Union[str, int]]]) -> None:
@@ -84,6 +101,8 @@ def save_role_perms(perms: Dict[str, List[Union[str, int]]]) -> None:
         fh.flush()
         os.fsync(fh.fileno())
     os.replace(str(tmp_path), str(_ROLEPERMS_FILENAME))
+    # Cached decisions were derived from the old mapping
+    permission_cache.clear()
 
 
 def get_permissions() -> List[str]:
@@ -180,11 +199,29 @@ def member_has_permission(member, permission: str) -> bool:
     return bool(member_role_ids.intersection(role_ids))
 
 
+def _evaluate_permission(guild, author, permission: str) -> bool:
+    """Uncached decision behind has_permission: owner / Manage Guild / Administrator bypass, then the role mapping."""
+    # Allow the guild owner to bypass checks
+    try:
+        if getattr(guild, "owner_id", None) == getattr(author, "id", None):
+            return True
+    except Exception:
+        # ignore attribute access issues and continue
+        pass
+
+    # Allow members with Manage Guild or Administrator permissions to bypass checks
+    gperms = getattr(author, "guild_permissions", None)
+    if gperms and (gperms.manage_guild or gperms.administrator):
+        return True
+    return member_has_permission(author, permission)
+
+
 # New: a convenient check decorator for command functions
 def has_permission(permission: str):
     """Return a decorator that checks the invoking user has `permission`.
 
     The check allows server administrators / members with manage_guild OR administrator to bypass the role mapping.
+    Decisions are cached per (guild, user, permission) for a short TTL; see bot.util.perm_cache.
     Use as:
         @has_permission("manage_economy")
         async def some_command(ctx, ...):
@@ -198,20 +235,12 @@ def has_permission(permission: str):
         author = getattr(ctx, "author", None)
         if author is None:
             raise commands.CheckFailure("Unable to determine invoking user.")
-        # Allow the guild owner to bypass checks
-        guild = getattr(ctx, "guild", None)
-        try:
-            if guild is not None and getattr(guild, "owner_id", None) == getattr(author, "id", None):
-                return True
-        except Exception:
-            # ignore attribute access issues and continue
-            pass
-
-        # Allow members with Manage Guild or Administrator permissions to bypass checks
-        gperms = getattr(author, "guild_permissions", None)
-        if gperms and (gperms.manage_guild or gperms.administrator):
-            return True
-        if member_has_permission(author, permission):
+        guild = ctx.guild
+        allowed = permission_cache.get(guild.id, author.id, permission)
+        if allowed is None:
+            allowed = _evaluate_permission(guild, author, permission)
+            permission_cache.set(guild.id, author.id, permission, allowed)
+        if allowed:
             return True
         # Deny with a clear message
         raise commands.CheckFailure(f"You do not have the required permission: {permission}")